@@ -22,6 +22,22 @@ def iso_to_epoch_sec(value: str | None) -> float | None:
         return None
 
 
+def fts_match_query(query_text: str) -> str | None:
+    """Turn free-form query text into an FTS5 MATCH expression.
+
+    Each whitespace token is quoted (so FTS operators in user input are
+    treated literally) and the last token becomes a prefix query, which
+    gives sensible search-as-you-type behaviour. Returns None when there
+    is nothing to match.
+    """
+    tokens = query_text.split()
+    if not tokens:
+        return None
+    quoted = ['"{}"'.format(t.replace('"', '""')) for t in tokens]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
 @dataclass(slots=True)
 class Job:
     id: int
@@ -49,6 +65,12 @@ class DB:
 
     def init_schema(self) -> None:
         with self.connect() as conn:
+            had_videos_fts = (
+                conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type='table' AND name='videos_fts'"
+                ).fetchone()
+                is not None
+            )
             conn.executescript(
                 """
                 CREATE TABLE IF NOT EXISTS ingest_jobs (
@@ -127,8 +149,35 @@ class DB:
                     INSERT INTO transcript_segments_fts(rowid, text)
                     VALUES (new.id, new.text);
                 END;
+
+                CREATE VIRTUAL TABLE IF NOT EXISTS videos_fts
+                USING fts5(title, video_id, content='videos', content_rowid='rowid');
+
+                CREATE TRIGGER IF NOT EXISTS videos_ai
+                AFTER INSERT ON videos BEGIN
+                    INSERT INTO videos_fts(rowid, title, video_id)
+                    VALUES (new.rowid, new.title, new.video_id);
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS videos_ad
+                AFTER DELETE ON videos BEGIN
+                    INSERT INTO videos_fts(videos_fts, rowid, title, video_id)
+                    VALUES ('delete', old.rowid, old.title, old.video_id);
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS videos_au
+                AFTER UPDATE ON videos BEGIN
+                    INSERT INTO videos_fts(videos_fts, rowid, title, video_id)
+                    VALUES ('delete', old.rowid, old.title, old.video_id);
+                    INSERT INTO videos_fts(rowid, title, video_id)
+                    VALUES (new.rowid, new.title, new.video_id);
+                END;
                 """
             )
+            if not had_videos_fts:
+                # Backfill the index for databases created before videos_fts
+                # existed; the triggers keep it current from here on.
+                conn.execute("INSERT INTO videos_fts(videos_fts) VALUES('rebuild')")
 
     def enqueue(self, urls: list[str], priority: int = 0) -> list[int]:
         now = utc_now_iso()
@@ -529,6 +578,46 @@ class DB:
         needle = query_text.strip().lower()
         if not needle:
             return []
+        match = fts_match_query(needle)
+        if match is not None:
+            try:
+                with self.connect() as conn:
+                    rows = conn.execute(
+                        """
+                        WITH latest_done AS (
+                            SELECT video_id, MAX(id) AS max_id
+                            FROM ingest_jobs
+                            WHERE status = 'done' AND video_id IS NOT NULL
+                            GROUP BY video_id
+                        )
+                        SELECT
+                            ts.video_id,
+                            COALESCE(v.title, ts.video_id) AS title,
+                            COUNT(*) AS match_count,
+                            MIN(ts.start_ms) AS first_start_ms,
+                            j.local_video_path,
+                            j.transcript_json_path
+                        FROM transcript_segments_fts f
+                        JOIN transcript_segments ts
+                          ON ts.id = f.rowid
+                        JOIN videos v
+                          ON v.video_id = ts.video_id
+                        LEFT JOIN latest_done ld
+                          ON ld.video_id = ts.video_id
+                        LEFT JOIN ingest_jobs j
+                          ON j.id = ld.max_id
+                        WHERE transcript_segments_fts MATCH ?
+                        GROUP BY ts.video_id, v.title, j.local_video_path, j.transcript_json_path
+                        ORDER BY match_count DESC, first_start_ms ASC
+                        LIMIT ?
+                        """,
+                        (match, limit),
+                    ).fetchall()
+                    return [dict(row) for row in rows]
+            except sqlite3.OperationalError:
+                # Query text the FTS5 parser rejects; fall through to the
+                # substring scan, which accepts anything.
+                pass
         with self.connect() as conn:
             rows = conn.execute(
                 """
@@ -563,11 +652,57 @@ class DB:
 
     def search_videos_by_title(self, query_text: str, *, limit: int = 200) -> list[dict[str, Any]]:
         needle = query_text.strip().lower()
+
+        def _with_counts(rows: list[sqlite3.Row]) -> list[dict[str, Any]]:
+            # SQLite's LOWER()/REPLACE() only fold ASCII, so counting in SQL
+            # reports zero matches for needles like "über" even on rows the
+            # query matched. The result set is capped at `limit`, so counting
+            # here in Python is cheap and Unicode-correct.
+            out = []
+            for row in rows:
+                d = dict(row)
+                d["match_count"] = d["title"].lower().count(needle) if needle else 1
+                out.append(d)
+            return out
+
+        match = fts_match_query(needle)
+        if match is not None:
+            try:
+                with self.connect() as conn:
+                    rows = conn.execute(
+                        """
+                        WITH latest_done AS (
+                            SELECT video_id, MAX(id) AS max_id
+                            FROM ingest_jobs
+                            WHERE status = 'done' AND video_id IS NOT NULL
+                            GROUP BY video_id
+                        )
+                        SELECT
+                            v.video_id,
+                            COALESCE(v.title, v.video_id) AS title,
+                            j.local_video_path,
+                            j.transcript_json_path
+                        FROM videos_fts f
+                        JOIN videos v
+                          ON v.rowid = f.rowid
+                        JOIN latest_done ld
+                          ON ld.video_id = v.video_id
+                        JOIN ingest_jobs j
+                          ON j.id = ld.max_id
+                        WHERE videos_fts MATCH ?
+                        ORDER BY LOWER(COALESCE(v.title, v.video_id)) ASC
+                        LIMIT ?
+                        """,
+                        (match, limit),
+                    ).fetchall()
+                    return _with_counts(rows)
+            except sqlite3.OperationalError:
+                pass
         where_clause = ""
         params: list[Any] = []
         if needle:
-            where_clause = "WHERE LOWER(COALESCE(v.title, v.video_id)) LIKE ?"
             params.append(f"%{needle}%")
+            where_clause = "WHERE LOWER(COALESCE(v.title, v.video_id)) LIKE ?"
         params.append(limit)
         with self.connect() as conn:
             rows = conn.execute(
@@ -594,6 +729,31 @@ class DB:
                 """,
                 tuple(params),
             ).fetchall()
+            return _with_counts(rows)
+
+    def list_video_titles(self) -> list[dict[str, Any]]:
+        with self.connect() as conn:
+            rows = conn.execute(
+                """
+                WITH latest_done AS (
+                    SELECT video_id, MAX(id) AS max_id
+                    FROM ingest_jobs
+                    WHERE status = 'done' AND video_id IS NOT NULL
+                    GROUP BY video_id
+                )
+                SELECT
+                    v.video_id,
+                    COALESCE(v.title, v.video_id) AS title,
+                    j.local_video_path,
+                    j.transcript_json_path
+                FROM videos v
+                JOIN latest_done ld
+                  ON ld.video_id = v.video_id
+                JOIN ingest_jobs j
+                  ON j.id = ld.max_id
+                ORDER BY LOWER(COALESCE(v.title, v.video_id)) ASC
+                """
+            ).fetchall()
             return [dict(row) for row in rows]
 
     def list_jobs_summary(self, limit: int = 25) -> dict[str, Any]:
@@ -274,15 +274,11 @@ class IngesterService:
         return self.db.search_videos_by_transcript(query_text, limit=limit)
 
     def search_video_titles(self, query_text: str, *, limit: int = 200) -> list[dict[str, object]]:
-        rows = self.db.search_videos_by_title(query_text, limit=limit)
-        needle = query_text.strip().lower()
-        out: list[dict[str, object]] = []
-        for row in rows:
-            payload = dict(row)
-            title = str(payload.get("title") or payload.get("video_id") or "")
-            payload["match_count"] = title.lower().count(needle) if needle else 1
-            out.append(payload)
-        return out
+        # match_count comes back filled in on every row; no hydration here.
+        return self.db.search_videos_by_title(query_text, limit=limit)
+
+    def list_video_titles(self) -> list[dict[str, object]]:
+        return self.db.list_video_titles()
 
     def jobs_summary(self, limit: int = 25) -> dict[str, object]:
         return self.db.list_jobs_summary(limit=limit)
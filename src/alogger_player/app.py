@@ -1,15 +1,28 @@
 from __future__ import annotations
 import vlc
 import json
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:  # optional fast path; stdlib json is the fallback
+    orjson = None
 import subprocess
 import sys
 import tkinter as tk
 import tkinter.font as tkfont
+from array import array
 from bisect import bisect_right
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from tkinter import ttk
-from typing import Any
+from typing import Any, Callable, NamedTuple
 
 from alog.config import IngesterConfig
 from alog.service import IngesterService
@@ -28,15 +41,105 @@ FONT = {
 THEME = {
 }
 
+# Font tuples derived from FONT, resolved once at import instead of
+# per-widget construction.
+HEADER_FONT = (FONT["STYLE"], FONT["SIZE"] - 3)
+LIST_FONT = (FONT["STYLE"], FONT["SIZE"] - 2)
+LIST_FONT_BOLD = (FONT["STYLE"], FONT["SIZE"] - 2, "bold")
+
+
+@lru_cache(maxsize=4096)
+def _display_title(raw: object, video_id: object) -> str:
+    """Normalize a title for single-line Listbox display.
+
+    Titles are immutable per video, so the cleanup runs once per title
+    rather than per row per keystroke.
+    """
+    return str(raw or video_id or "untitled").replace("\n", " ").strip()
+
+
+def _hint_label(parent: tk.Misc, text: str, *, pady: int = 4) -> tk.Label:
+    """Small grey caption/hint label shared by the popups."""
+    return tk.Label(
+        parent,
+        text=text,
+        anchor="w",
+        bg="#0d0d0d",
+        fg="#8f8f8f",
+        font=HEADER_FONT,
+        padx=8,
+        pady=pady,
+    )
+
+
+def _result_listbox(
+    parent: tk.Misc,
+    *,
+    bold: bool = False,
+    width: int | None = None,
+    fg: str = "#ffffff",
+    takefocus: bool = True,
+    listvariable: tk.Variable | None = None,
+) -> tk.Listbox:
+    """Preconfigured dark Listbox used for popup result columns."""
+    kwargs: dict[str, Any] = {}
+    if width is not None:
+        kwargs["width"] = width
+    if not takefocus:
+        kwargs["takefocus"] = 0
+    if listvariable is not None:
+        kwargs["listvariable"] = listvariable
+    return tk.Listbox(
+        parent,
+        bg="#000000",
+        fg=fg,
+        selectbackground="#161616",
+        selectforeground=fg,
+        activestyle="none",
+        borderwidth=0,
+        highlightthickness=0,
+        font=LIST_FONT_BOLD if bold else LIST_FONT,
+        exportselection=False,
+        **kwargs,
+    )
+
+# Conventional audio-sidecar extensions, most common first: checked as
+# exact filenames before falling back to a directory scan.
+_AUDIO_SIDECAR_EXTS = (".m4a", ".opus", ".mp3", ".aac", ".wav")
+
+# Jobs popup row layout: one shared template instead of re-spelling the
+# column widths in the refresh loop, so header and rows cannot drift.
+_JOBS_HEADER = "id    status        video_id       created_at"
+_JOBS_ROW = "{id:<5} {status:<12} {video_id:<13} {created_at}"
+
+# Version tag of the binary transcript sidecar (bump on format changes).
+_SIDECAR_MAGIC = b"ALOGIDX2"
+
+# Two-digit strings 00..59, so the per-tick formatter interpolates cached
+# strings instead of running three zero-padded int formats.
+_HMS_2D = tuple(f"{i:02d}" for i in range(60))
+
+@lru_cache(maxsize=1024)
+def _probe_audio(path_str: str, mtime_ns: int, size: int) -> bool | None:
+    """Memoized ffprobe: keyed by (path, mtime, size) so unchanged files
+    never get probed twice across session loads."""
+    return _media_has_audio_stream(Path(path_str))
+
+@lru_cache(maxsize=1024)
+def _probe_video(path_str: str, mtime_ns: int, size: int) -> bool | None:
+    return _media_has_video_stream(Path(path_str))
+
 def _fmt_hms(seconds: float) -> str:
     total = max(0, int(seconds))
-    h = total // 3600
-    m = (total % 3600) // 60
-    s = total % 60
-    return f"{h:02d}:{m:02d}:{s:02d}"
+    h, rem = divmod(total, 3600)
+    m, s = divmod(rem, 60)
+    if h < 60:
+        return f"{_HMS_2D[h]}:{_HMS_2D[m]}:{_HMS_2D[s]}"
+    return f"{h:02d}:{_HMS_2D[m]}:{_HMS_2D[s]}"
+
+class SegmentRow(NamedTuple):
+    """Lightweight per-segment view over the column arrays."""
 
-@dataclass(slots=True)
-class SegmentRow:
     index:     int
     start_sec: float
     end_sec:   float
@@ -44,6 +147,17 @@ class SegmentRow:
     text_lc:   str
 
 class TranscriptPlayer:
+    # Prebuilt bar glyph runs sized to the widest bar _update_progress_bar_width
+    # can produce (140 chars + 24 pad); sliced per tick instead of rebuilt.
+    _BAR_MAX = 164
+    _BAR_FULL = "█" * _BAR_MAX
+    _BAR_EMPTY = "░" * _BAR_MAX
+    # Rows rendered above/below the window center in the caption view.
+    _RENDER_OVERSCAN = 250
+    # Result rows inserted into a popup Listbox per page; more stream in
+    # as the user scrolls or arrows toward the bottom.
+    _POPUP_PAGE = 100
+
     def __init__(
         self,
         transcript_json: Path | None = None,
@@ -60,19 +174,55 @@ class TranscriptPlayer:
         self.start_sec = max(0.0, float(start_sec))
         self.workers = max(0, int(workers))
 
-        self.segments = self._load_segments(transcript_json) if transcript_json else []
-        self._segment_starts = [seg.start_sec for seg in self.segments]
-        self.filtered_indexes = list(range(len(self.segments)))
+        # Segment columns (structure-of-arrays): scans touch only the column
+        # they need instead of chasing one object per segment.
+        self._seg_ids:   list[int] = []
+        self._starts = array("d")
+        self._ends = array("d")
+        self._texts:     list[str] = []
+        self._texts_lc:  list[str] = []
+        self._texts_lc_b: list[bytes] = []
+        self._joined_lc_b = b""
+        self._joined_offsets: list[int] = []
+        self._trigram_index: dict[str, set[int]] = {}
+        self._prefixes: list[str] = []
+        self._prefix_lens: list[int] = []
+        if transcript_json:
+            self._load_segments(transcript_json)
+        # Packed columns: int32 indexes and double starts keep the filtered
+        # subset compact and bisect-friendly for large transcripts.
+        self.filtered_indexes = array("i", range(len(self._texts)))
+        self._filtered_starts = self._starts[:]
         self.selected_filtered_pos = 0
-        
+        self._last_filter_query = ""
+        self._filter_after_id: str | None = None
+        self._resize_after_id: str | None = None
+        self._pending_left_width = 0
+        self._pending_skim = 0.0
+        self._skim_after_id: str | None = None
+        self._filter_cache: dict[str, array] = {}
+        self._match_pat = re.compile("")
+        self._match_pat_query = ""
+
         self._search_popup:         tk.Toplevel | None = None
         self._video_picker_popup:   tk.Toplevel | None = None
         self._ingest_popup:         tk.Toplevel | None = None
         self._jobs_popup:           tk.Toplevel | None = None
         self._jobs_text:            tk.Text | None = None
         self._jobs_after_id:        str | None = None
+        self._jobs_last_payload:    str | None = None
+        self._jobs_fetch_inflight = False
+        self._jobs_interval_ms = 1000
+        self._search_after_id:      str | None = None
+        self._picker_after_id:      str | None = None
         self._search_results:       list[dict[str, Any]] = []
         self._video_picker_results: list[dict[str, Any]] = []
+        self._popup_query_cache:    dict[tuple[str, str], list[dict[str, Any]]] = {}
+        self._title_lower:          list[tuple[str, dict[str, Any]]] | None = None
+        self._sidecar_index:        dict[str, Path] | None = None
+        self._search_popup_reopen:  Callable[[], None] | None = None
+        self._picker_popup_reopen:  Callable[[], None] | None = None
+        self._ingest_popup_reopen:  Callable[[], None] | None = None
         self._split_initialized =   False
         self._transcript_hidden =   False
         self._split_x_before_hide:  int | None = None
@@ -81,6 +231,10 @@ class TranscriptPlayer:
         self._startup_poll_count =  0
         self._proxy_attempted =     False
 
+        # Blocking ingester calls (URL inspection, enqueue) run here so the
+        # Tk mainloop never waits on the network.
+        self._url_executor = ThreadPoolExecutor(max_workers=2)
+
         self.ingester_config = IngesterConfig.from_env()
         self.ingester = IngesterService(self.ingester_config)
         self.ingester.init()
@@ -94,9 +248,20 @@ class TranscriptPlayer:
 
         self._text_font = tkfont.Font(family=FONT['STYLE'], size=FONT['SIZE'])
         self._text_font_bold = tkfont.Font(family=FONT['STYLE'], size=FONT['SIZE'], weight="bold")
+        # Shared resolved fonts for the chrome widgets: one Font object per
+        # spec instead of Tk re-parsing the same tuple per widget, and a
+        # single configure() point if these ever need to change at runtime.
+        self._font_status = tkfont.Font(family=FONT['STYLE'], size=FONT['SIZE'])
+        self._font_small = tkfont.Font(family=FONT['STYLE'], size=FONT['SIZE'] - 2)
+        self._font_small_bold = tkfont.Font(family=FONT['STYLE'], size=FONT['SIZE'] - 2, weight="bold")
         self._timestamp_prefix = "[00:00:00] "
-        self._wrap_indent_px = self._text_font.measure(self._timestamp_prefix)
+        self._measure_font_metrics()
         self._progress_bar_width = 28
+        self._clock_cache_key: tuple[str, int, int] | None = None
+        self._clock_cache_text = ""
+        self._last_caption_idx = -1
+        self._last_clock_text = ""
+        self._last_caption_text = ""
 
         self._setup_styles()
         self._build_layout()
@@ -106,8 +271,20 @@ class TranscriptPlayer:
         self._refresh_caption_view()
         if not self.video_path:
             self.status_var.set("No video loaded. Press Ctrl-O to open by title or Ctrl-F to search captions.")
+        # Warm the sidecar index off-thread once the mainloop is idle so
+        # the first Ctrl-O/Ctrl-F open resolves audio sidecars instantly.
+        self.root.after_idle(
+            lambda: self._url_executor.submit(self._build_sidecar_index)
+        )
         self._tick_ui()
 
+    def _measure_font_metrics(self) -> None:
+        # Font.measure round-trips through Tcl; do it once per font size
+        # instead of on every panel resize/refresh.
+        self._wrap_indent_px = self._text_font.measure(self._timestamp_prefix)
+        self._prefix_px = self._wrap_indent_px
+        self._block_px = max(1, self._text_font.measure("█"))
+
     def _setup_styles(self) -> None:
         style = ttk.Style(self.root)
         style.theme_use("clam")
@@ -139,7 +316,10 @@ class TranscriptPlayer:
         shell.add(right, minsize=200)
         
         shell.bind("<Configure>", self._on_shell_configure)
-        self.root.after(0, self._set_initial_split_ratio)
+        if shell.winfo_ismapped():
+            self._set_initial_split_ratio()
+        else:
+            self.root.after(0, self._set_initial_split_ratio)
 
         left.rowconfigure(0, weight=1)
         left.columnconfigure(0, weight=1)
@@ -160,7 +340,7 @@ class TranscriptPlayer:
             justify="left",
             bg="#000000",
             fg="#f7d154",
-            font=(FONT['STYLE'], FONT['SIZE']-2, "bold"),
+            font=self._font_small_bold,
             padx=10,
             pady=6,
         )
@@ -174,7 +354,7 @@ class TranscriptPlayer:
             justify="left",
             bg="#000000",
             fg="#ffffff",
-            font=(FONT['STYLE'], FONT['SIZE']-2),
+            font=self._font_small,
             padx=10,
             pady=8,
             wraplength=400,
@@ -189,7 +369,7 @@ class TranscriptPlayer:
             anchor="w",
             bg="#0d0d0d",
             fg="#d2d2d2",
-            font=(FONT['STYLE'], FONT['SIZE']),
+            font=self._font_status,
             padx=10,
             pady=6,
         )
@@ -240,8 +420,17 @@ class TranscriptPlayer:
         self.caption_view.tag_configure("selected", background="#282828")
         self.caption_view.tag_configure("selected_txt", font=self._text_font_bold)
 
-        self._row_ranges: list[tuple[str, str]] = []
-        self._row_text_ranges: list[tuple[str, str]] = []
+        self.caption_view.configure(yscrollcommand=self._on_caption_yscroll)
+
+        # Per rendered row: prefix length and text end column, packed as
+        # int32. Rows are consecutive lines from 1, so every Tk index the
+        # selection needs is reconstructed as f"{local + 1}.{col}" on demand
+        # instead of keeping ~4 small strings per row alive.
+        self._row_plens = array("i")
+        self._row_text_ends = array("i")
+        self._render_window: tuple[int, int] = (0, 0)
+        self._caption_rebuilding = False
+        self._scroll_rebuild_pending = False
 
         self.hint_var = tk.StringVar(value=(
             "Type=precise filter | Up/Down=hover | Enter=jump | Ctrl-Space/Ctrl-P play/pause | "
@@ -256,7 +445,7 @@ class TranscriptPlayer:
             justify="left",
             bg="#0d0d0d",
             fg="#8f8f8f",
-            font=(FONT['STYLE'], FONT['SIZE']-2),
+            font=self._font_small,
             padx=8,
             pady=6,
         )
@@ -301,11 +490,29 @@ class TranscriptPlayer:
             raise Exception('self.instance failed to load.')
 
         self.player = self.instance.media_player_new()
+        self._player_snapshot: tuple[Any, int, int] = (vlc.State.NothingSpecial, 0, 0)
+        self._player_poll_stop = threading.Event()
+        threading.Thread(target=self._poll_player_loop, daemon=True).start()
         if self.video_path:
             if not self.video_path.exists():
                 raise FileNotFoundError(f"video path not found: {self.video_path}")
             self._set_player_media(self.video_path, self.audio_path, self.start_sec)
 
+    def _poll_player_loop(self) -> None:
+        # libvlc getters take an internal lock and can stall; keep them off
+        # the Tk thread and publish one atomic (state, time, length) tuple
+        # for the UI tick to read.
+        while not self._player_poll_stop.is_set():
+            try:
+                self._player_snapshot = (
+                    self.player.get_state(),
+                    self.player.get_time(),
+                    self.player.get_length(),
+                )
+            except Exception:
+                pass
+            time.sleep(0.2)
+
     def _set_player_media(self, video_path: Path, audio_path: Path | None, start_sec: float = 0.0) -> None:
         if not video_path.exists():
             raise FileNotFoundError(f"video path not found: {video_path}")
@@ -370,12 +577,16 @@ class TranscriptPlayer:
                     self._set_player_media(alt, None, start_sec=start_sec)
                     return
                 if not self._proxy_attempted:
-                    proxy = self._generate_proxy_playback(self.video_path, self.audio_path)
-                    if proxy is not None and proxy.exists():
-                        self._proxy_attempted = True
-                        self.status_var.set(f"Retrying with compatibility proxy: {proxy.name}")
-                        self._set_player_media(proxy, None, start_sec=start_sec)
-                        return
+                    # The ffmpeg transcode can run for minutes; do it on a
+                    # worker thread and come back via root.after.
+                    self._proxy_attempted = True
+                    self.status_var.set("Media load failed; building compatibility proxy...")
+                    threading.Thread(
+                        target=self._build_proxy_and_retry,
+                        args=(self.video_path, self.audio_path, start_sec),
+                        daemon=True,
+                    ).start()
+                    return
                 self.status_var.set(f"Failed to load media: {self.video_path} (state={state})")
                 return
 
@@ -386,6 +597,17 @@ class TranscriptPlayer:
         self._load_fail_count = 0
         self._startup_poll_count = 0
 
+    def _build_proxy_and_retry(self, video_path: Path, audio_path: Path | None, start_sec: float) -> None:
+        proxy = self._generate_proxy_playback(video_path, audio_path)
+        self.root.after(0, lambda: self._on_proxy_ready(proxy, start_sec))
+
+    def _on_proxy_ready(self, proxy: Path | None, start_sec: float) -> None:
+        if proxy is not None and proxy.exists():
+            self.status_var.set(f"Retrying with compatibility proxy: {proxy.name}")
+            self._set_player_media(proxy, None, start_sec=start_sec)
+            return
+        self.status_var.set(f"Failed to load media: {self.video_path}")
+
     def _generate_proxy_playback(self, video_path: Path, audio_path: Path | None) -> Path | None:
         if not self.current_video_id:
             return None
@@ -453,100 +675,390 @@ class TranscriptPlayer:
         )
         return candidates[0]
 
-    def _load_segments(self, transcript_json: Path) -> list[SegmentRow]:
+    def _load_segments(self, transcript_json: Path) -> None:
         if not transcript_json.exists():
             raise FileNotFoundError(f"transcript json not found: {transcript_json}")
-        payload = json.loads(transcript_json.read_text(encoding="utf-8"))
+        if self._load_segment_sidecar(transcript_json):
+            self._finalize_segment_columns()
+            return
+        raw = transcript_json.read_bytes()
+        payload = orjson.loads(raw) if orjson is not None else json.loads(raw)
         raw_segments = payload.get("segments", [])
         if not isinstance(raw_segments, list):
             raise ValueError("transcript JSON has no valid 'segments' list")
 
-        rows: list[SegmentRow] = []
+        seg_ids: list[int] = []
+        starts: list[float] = []
+        ends: list[float] = []
+        texts: list[str] = []
+        texts_lc: list[str] = []
         for i, seg in enumerate(raw_segments):
             text = str(seg.get("text", "")).strip().replace("\n", " ")
             if not text:
                 continue
             start_sec = float(seg.get("start", 0.0))
-            end_sec = float(seg.get("end", start_sec))
-            rows.append(SegmentRow(
-                index=i,
-                start_sec=start_sec,
-                end_sec=end_sec,
-                text=text,
-                text_lc=text.lower(),
-            ))
-        return rows
+            seg_ids.append(i)
+            starts.append(start_sec)
+            ends.append(float(seg.get("end", start_sec)))
+            texts.append(text)
+            # lower(), not casefold(): the lowered column must stay
+            # char-aligned with the displayed text because match-tag offsets
+            # are computed on it (casefold can change string length, e.g.
+            # "ß" -> "ss", shifting every highlight after it).
+            texts_lc.append(text.lower())
+        self._seg_ids = seg_ids
+        # Packed C doubles: contiguous for the bisect in _caption_text_at
+        # instead of a pointer array of boxed floats.
+        self._starts = array("d", starts)
+        self._ends = array("d", ends)
+        self._texts = texts
+        self._texts_lc = texts_lc
+        self._finalize_segment_columns()
+        self._write_segment_sidecar(transcript_json)
+
+    @staticmethod
+    def _segment_sidecar_path(transcript_json: Path) -> Path:
+        return transcript_json.with_suffix(transcript_json.suffix + ".idx")
+
+    def _load_segment_sidecar(self, transcript_json: Path) -> bool:
+        """Load the binary sidecar written by a previous run, if still fresh.
+
+        Returns False on any mismatch (missing, stale, wrong version, short
+        read) so the caller falls back to parsing the JSON."""
+        sidecar = self._segment_sidecar_path(transcript_json)
+        try:
+            if sidecar.stat().st_mtime < transcript_json.stat().st_mtime:
+                return False
+            with open(sidecar, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm[: len(_SIDECAR_MAGIC)] != _SIDECAR_MAGIC:
+                    return False
+                total = mm.size()
+                off = len(_SIDECAR_MAGIC)
+                (count,) = struct.unpack_from("<i", mm, off)
+                if count < 0:
+                    return False
+                off += 4
+
+                def _column(typecode: str, itemsize: int) -> array:
+                    nonlocal off
+                    col = array(typecode)
+                    col.frombytes(mm[off:off + itemsize * count])
+                    off += itemsize * count
+                    return col
+
+                starts = _column("d", 8)
+                ends = _column("d", 8)
+                seg_ids = _column("i", 4)
+                text_lens = _column("i", 4)
+                lc_lens = _column("i", 4)
+                texts: list[str] = []
+                for ln in text_lens:
+                    texts.append(mm[off:off + ln].decode("utf-8"))
+                    off += ln
+                texts_lc: list[str] = []
+                for ln in lc_lens:
+                    texts_lc.append(mm[off:off + ln].decode("utf-8"))
+                    off += ln
+        except (OSError, ValueError, struct.error, UnicodeDecodeError):
+            return False
+        # A truncated file yields short columns or slack at the end rather
+        # than an exception, so require every column to be full length and
+        # the final read to land exactly on EOF.
+        if (
+            off != total
+            or len(starts) != count
+            or len(ends) != count
+            or len(seg_ids) != count
+            or len(text_lens) != count
+            or len(lc_lens) != count
+            or len(texts) != count
+            or len(texts_lc) != count
+        ):
+            return False
+        self._seg_ids = list(seg_ids)
+        self._starts = starts
+        self._ends = ends
+        self._texts = texts
+        self._texts_lc = texts_lc
+        return True
+
+    def _write_segment_sidecar(self, transcript_json: Path) -> None:
+        sidecar = self._segment_sidecar_path(transcript_json)
+        tmp = sidecar.with_suffix(sidecar.suffix + ".tmp")
+        texts_b = [t.encode("utf-8") for t in self._texts]
+        texts_lc_b = self._texts_lc_b
+        try:
+            # Write to a temp file and rename so a crash mid-write never
+            # leaves a truncated sidecar that shadows the JSON next startup.
+            with open(tmp, "wb") as f:
+                f.write(_SIDECAR_MAGIC)
+                f.write(struct.pack("<i", len(texts_b)))
+                f.write(self._starts.tobytes())
+                f.write(self._ends.tobytes())
+                f.write(array("i", self._seg_ids).tobytes())
+                f.write(array("i", [len(b) for b in texts_b]).tobytes())
+                f.write(array("i", [len(b) for b in texts_lc_b]).tobytes())
+                f.write(b"".join(texts_b))
+                f.write(b"".join(texts_lc_b))
+            os.replace(tmp, sidecar)
+        except OSError:
+            # The sidecar is purely a cache; a read-only transcript dir just
+            # means the next startup parses JSON again.
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+    def _finalize_segment_columns(self) -> None:
+        starts = self._starts
+        texts_lc = self._texts_lc
+        # Start times never change, so the "[HH:MM:SS] " prefixes and their
+        # lengths are formatted once here instead of per refresh.
+        self._prefixes = [f"[{_fmt_hms(s)}] " for s in starts]
+        self._prefix_lens = [len(p) for p in self._prefixes]
+        # UTF-8 copies for the membership filter: bytes.__contains__ runs the
+        # C fast path and skips per-comparison unicode handling. Offsets for
+        # highlighting still come from the str column.
+        self._texts_lc_b = [t.encode("utf-8") for t in texts_lc]
+        # One joined buffer lets a full rescan run as a handful of bytes.find
+        # calls instead of one __contains__ dispatch per row. \x01 never
+        # occurs in stripped transcript text, so matches cannot span rows.
+        offsets: list[int] = []
+        off = 0
+        for t in self._texts_lc_b:
+            offsets.append(off)
+            off += len(t) + 1
+        self._joined_lc_b = b"\x01".join(self._texts_lc_b)
+        self._joined_offsets = offsets
+        # Trigram postings: queries of 3+ chars intersect a few posting sets
+        # and verify only those candidates instead of scanning every row.
+        trigram_index: dict[str, set[int]] = {}
+        for row_idx, text_lc in enumerate(texts_lc):
+            for i in range(len(text_lc) - 2):
+                trigram_index.setdefault(text_lc[i:i + 3], set()).add(row_idx)
+        self._trigram_index = trigram_index
+
+    def _seg(self, idx: int) -> SegmentRow:
+        return SegmentRow(
+            index=self._seg_ids[idx],
+            start_sec=self._starts[idx],
+            end_sec=self._ends[idx],
+            text=self._texts[idx],
+            text_lc=self._texts_lc[idx],
+        )
+
+    def _match_pattern(self, query: str) -> re.Pattern[str]:
+        # One compiled literal pattern per query; the scroll-driven window
+        # re-renders reuse it across rebuilds for the same query.
+        if self._match_pat_query != query:
+            self._match_pat = re.compile(re.escape(query))
+            self._match_pat_query = query
+        return self._match_pat
+
+    def _trigram_candidates(self, query: str) -> list[int]:
+        index = self._trigram_index
+        postings: list[set[int]] = []
+        for i in range(len(query) - 2):
+            posting = index.get(query[i:i + 3])
+            if not posting:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+        return sorted(set.intersection(*postings))
+
+    def _scan_joined(self, query_b: bytes) -> list[int]:
+        # Full rescan over the joined lowercased buffer: each bytes.find call
+        # covers many rows in C, and every hit maps back to its row through
+        # the offset table. After a hit the scan resumes at the next row, so
+        # the result is one sorted index per matching segment.
+        data = self._joined_lc_b
+        offsets = self._joined_offsets
+        hits: list[int] = []
+        pos = data.find(query_b)
+        while pos != -1:
+            idx = bisect_right(offsets, pos) - 1
+            hits.append(idx)
+            next_off = offsets[idx + 1] if idx + 1 < len(offsets) else len(data)
+            pos = data.find(query_b, next_off)
+        return hits
+
+    def _normalized_query(self) -> str:
+        return self.filter_var.get().strip().lower()
 
     def _on_filter_change(self, *_args: object) -> None:
-        query = self.filter_var.get().strip().lower()
+        # Coalesce keystroke bursts: only the last write within the debounce
+        # window pays for a filter pass and caption rebuild.
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.root.after(120, self._apply_filter)
+
+    def _apply_filter(self) -> None:
+        self._filter_after_id = None
+        query = self._normalized_query()
+        prev_query = self._last_filter_query
+        self._last_filter_query = query
+        texts_lc_b = self._texts_lc_b
+        query_b = query.encode("utf-8")
         if not query:
-            self.filtered_indexes = list(range(len(self.segments)))
+            self.filtered_indexes = array("i", range(len(self._texts)))
+        elif query in self._filter_cache:
+            # Backspacing retraces earlier queries; reuse their results.
+            self.filtered_indexes = self._filter_cache[query][:]
+        elif prev_query and query.startswith(prev_query):
+            # Typing extended the previous query: every match is already in
+            # the current subset, so narrow it instead of rescanning all rows.
+            self.filtered_indexes = array(
+                "i", (idx for idx in self.filtered_indexes if query_b in texts_lc_b[idx])
+            )
+        elif len(query) >= 3:
+            candidates = self._trigram_candidates(query)
+            self.filtered_indexes = array(
+                "i", (idx for idx in candidates if query_b in texts_lc_b[idx])
+            )
         else:
-            self.filtered_indexes = [idx for idx, seg in enumerate(self.segments) if query in seg.text_lc]
+            self.filtered_indexes = array("i", self._scan_joined(query_b))
+        if query:
+            if len(self._filter_cache) >= 32:
+                self._filter_cache.pop(next(iter(self._filter_cache)))
+            self._filter_cache[query] = self.filtered_indexes[:]
+        # Keep the start-time column of the visible subset alongside the
+        # indexes so rendering and jumps avoid a per-row indirection.
+        starts = self._starts
+        self._filtered_starts = array("d", (starts[idx] for idx in self.filtered_indexes))
         self.selected_filtered_pos = 0
-        self._refresh_caption_view()
-
-    def _refresh_caption_view(self) -> None:
+        self._refresh_caption_view(query)
+
+    def _refresh_caption_view(self, query: str | None = None, center_pos: int | None = None) -> None:
+        if query is None:
+            query = self._normalized_query()
+        if center_pos is None:
+            center_pos = self.selected_filtered_pos
+
+        # Viewport virtualization: only the rows within an overscan window
+        # around center_pos are materialized in the Text widget, so rebuild
+        # cost is O(window) instead of O(filtered rows). Scrolling near a
+        # window edge re-renders around the new center (_on_caption_yscroll).
+        n = len(self.filtered_indexes)
+        win_lo = max(0, min(center_pos, n) - self._RENDER_OVERSCAN)
+        win_hi = min(n, center_pos + self._RENDER_OVERSCAN + 1)
+        self._render_window = (win_lo, win_hi)
+
+        self._caption_rebuilding = True
         self.caption_view.configure(state="normal")
         self.caption_view.delete("1.0", tk.END)
-        self._row_ranges = []
-        self._row_text_ranges = []
-        query = self.filter_var.get().strip().lower()
-
-        for seg_idx in self.filtered_indexes:
-            seg = self.segments[seg_idx]
-            line_start = self.caption_view.index("end-1c")
-            prefix = f"[{_fmt_hms(seg.start_sec)}] "
-            self.caption_view.insert(tk.END, prefix + seg.text + "\n", ("row",))
-            self.caption_view.tag_add("ts", line_start, f"{line_start}+{len(prefix)}c")
-            self.caption_view.tag_add( "txt", f"{line_start}+{len(prefix)}c", f"{line_start}+{len(prefix) + len(seg.text)}c",)
-            self._row_text_ranges.append(( f"{line_start}+{len(prefix)}c", f"{line_start}+{len(prefix) + len(seg.text)}c",))
-            line_end = self.caption_view.index("end-1c")
-            self._row_ranges.append((line_start, line_end))
-
-            if query:
-                pos = 0
-                while True:
-                    hit = seg.text_lc.find(query, pos)
-                    if hit == -1:
-                        break
-                    s = f"{line_start}+{len(prefix) + hit}c"
-                    e = f"{line_start}+{len(prefix) + hit + len(query)}c"
-                    self.caption_view.tag_add("match", s, e)
-                    pos = hit + len(query)
+        row_plens = array("i")
+        row_text_ends = array("i")
+
+        # Every row is one logical line, so all tag indexes can be serialized
+        # up front as "line.col" strings and applied in one tag_add per tag
+        # instead of one Tcl round-trip per row.
+        lines: list[str] = []
+        ts_spans: list[str] = []
+        txt_spans: list[str] = []
+        match_spans: list[str] = []
+        pat = self._match_pattern(query) if query else None
+        # Hoist attribute lookups out of the row loop: each one is a dict
+        # probe per iteration that the loop body pays thousands of times.
+        texts = self._texts
+        texts_lc = self._texts_lc
+        prefixes = self._prefixes
+        prefix_lens = self._prefix_lens
+        lines_append = lines.append
+        ts_extend = ts_spans.extend
+        txt_extend = txt_spans.extend
+        match_extend = match_spans.extend
+        plen_append = row_plens.append
+        text_end_append = row_text_ends.append
+        finditer = pat.finditer if pat is not None else None
+        line = 1
+        for seg_idx in self.filtered_indexes[win_lo:win_hi]:
+            text = texts[seg_idx]
+            prefix = prefixes[seg_idx]
+            plen = prefix_lens[seg_idx]
+            lines_append(prefix + text + "\n")
+            ts_extend((f"{line}.0", f"{line}.{plen}"))
+            end_col = plen + len(text)
+            txt_extend((f"{line}.{plen}", f"{line}.{end_col}"))
+            plen_append(plen)
+            text_end_append(end_col)
+
+            if finditer is not None:
+                for m in finditer(texts_lc[seg_idx]):
+                    match_extend((f"{line}.{plen + m.start()}", f"{line}.{plen + m.end()}"))
+            line += 1
+        self._row_plens = row_plens
+        self._row_text_ends = row_text_ends
+
+        if lines:
+            self.caption_view.insert("1.0", "".join(lines), ("row",))
+            self.caption_view.tag_add("ts", *ts_spans)
+            self.caption_view.tag_add("txt", *txt_spans)
+            if match_spans:
+                self.caption_view.tag_add("match", *match_spans)
 
         if self.filtered_indexes:
-            self._select_pos(self.selected_filtered_pos)
+            if win_lo <= self.selected_filtered_pos < win_hi:
+                self._select_pos(self.selected_filtered_pos)
         else:
             self.status_var.set("No matching transcript segments")
         self.caption_view.configure(state="disabled")
+        self._caption_rebuilding = False
+
+    def _on_caption_yscroll(self, first: str, last: str) -> None:
+        if self._caption_rebuilding or self._scroll_rebuild_pending:
+            return
+        fl, ll = float(first), float(last)
+        win_lo, win_hi = self._render_window
+        n = len(self.filtered_indexes)
+        if not ((fl <= 0.02 and win_lo > 0) or (ll >= 0.98 and win_hi < n)):
+            return
+        self._scroll_rebuild_pending = True
+        center = win_lo + int(((fl + ll) / 2.0) * max(1, win_hi - win_lo))
+        self.root.after_idle(lambda: self._rebuild_window_around(center))
+
+    def _rebuild_window_around(self, center: int) -> None:
+        self._scroll_rebuild_pending = False
+        self._refresh_caption_view(center_pos=center)
+        win_lo = self._render_window[0]
+        self.caption_view.see(f"{max(1, center - win_lo + 1)}.0")
 
     def _select_pos(self, pos: int) -> None:
         if not self.filtered_indexes:
             return
         pos = max(0, min(pos, len(self.filtered_indexes) - 1))
         self.selected_filtered_pos = pos
+        win_lo, win_hi = self._render_window
+        if pos < win_lo or pos >= win_hi:
+            # Selection moved outside the rendered window: re-render around
+            # it; the refresh re-applies the selection tags.
+            self._refresh_caption_view(center_pos=pos)
+            return
+        local = pos - win_lo
 
         self.caption_view.configure(state="normal")
         self.caption_view.tag_remove("selected", "1.0", tk.END)
         self.caption_view.tag_remove("selected_txt", "1.0", tk.END)
-        line_start, line_end = self._row_ranges[pos]
-        self.caption_view.tag_add("selected", line_start, line_end)
-        text_start, text_end = self._row_text_ranges[pos]
-        self.caption_view.tag_add("selected_txt", text_start, text_end)
+        line = local + 1
+        line_start = f"{line}.0"
+        self.caption_view.tag_add("selected", line_start, f"{line + 1}.0")
+        self.caption_view.tag_add(
+            "selected_txt",
+            f"{line}.{self._row_plens[local]}",
+            f"{line}.{self._row_text_ends[local]}",
+        )
         self.caption_view.see(line_start)
         self.caption_view.configure(state="disabled")
 
-        seg = self.segments[self.filtered_indexes[pos]]
+        seg_idx = self.filtered_indexes[pos]
         self.status_var.set(
-            f"Hovering segment #{seg.index} @ {_fmt_hms(seg.start_sec)} | "
+            f"Hovering segment #{self._seg_ids[seg_idx]} @ {_fmt_hms(self._filtered_starts[pos])} | "
             f"matches={len(self.filtered_indexes)}"
         )
 
     def _current_segment(self) -> SegmentRow | None:
         if not self.filtered_indexes:
             return None
-        return self.segments[self.filtered_indexes[self.selected_filtered_pos]]
+        return self._seg(self.filtered_indexes[self.selected_filtered_pos])
 
     def _on_up(self, _event: tk.Event[tk.Misc]) -> str:
         if self._transcript_hidden:
@@ -570,9 +1082,9 @@ class TranscriptPlayer:
 
     def _on_double_click(self, event: tk.Event[tk.Misc]) -> str:
         click_index = self.caption_view.index(f"@{event.x},{event.y}")
-        line = int(click_index.split(".")[0]) - 1
-        if 0 <= line < len(self.filtered_indexes):
-            self._select_pos(line)
+        pos = int(click_index.split(".")[0]) - 1 + self._render_window[0]
+        if 0 <= pos < len(self.filtered_indexes):
+            self._select_pos(pos)
         return self._on_return(event)
 
     def _on_toggle_play(self, _event: tk.Event[tk.Misc]) -> str:
@@ -594,13 +1106,29 @@ class TranscriptPlayer:
         return "break"
 
     def _on_left(self, _event: tk.Event[tk.Misc]) -> str:
-        self._seek_relative(-self.skim_seconds)
+        self._queue_skim(-self.skim_seconds)
         return "break"
 
     def _on_right(self, _event: tk.Event[tk.Misc]) -> str:
-        self._seek_relative(self.skim_seconds)
+        self._queue_skim(self.skim_seconds)
         return "break"
 
+    def _queue_skim(self, delta_sec: float) -> None:
+        # Holding an arrow key auto-repeats dozens of presses per second and
+        # each set_time invalidates VLC's decoder state; accumulate the burst
+        # and issue one seek once the repeats pause.
+        self._pending_skim += delta_sec
+        if self._skim_after_id is not None:
+            self.root.after_cancel(self._skim_after_id)
+        self._skim_after_id = self.root.after(60, self._flush_skim)
+
+    def _flush_skim(self) -> None:
+        self._skim_after_id = None
+        delta_sec = self._pending_skim
+        self._pending_skim = 0.0
+        if delta_sec:
+            self._seek_relative(delta_sec)
+
     def _on_quit(self, _event: tk.Event[tk.Misc]) -> str:
         self.close()
         return "break"
@@ -646,9 +1174,14 @@ class TranscriptPlayer:
             return
         self._text_font.configure(size=new_size)
         self._text_font_bold.configure(size=new_size)
-        self._wrap_indent_px = self._text_font.measure(self._timestamp_prefix)
+        self._measure_font_metrics()
+        # The widget and tags reference named Font objects, so Tk rewraps the
+        # existing buffer on its own when the font size changes; only the
+        # wrap indent needs reconfiguring — no rebuild.
         self.caption_view.tag_configure("row", lmargin1=0, lmargin2=self._wrap_indent_px)
-        self._refresh_caption_view()
+        win_lo, win_hi = self._render_window
+        if self._row_plens and win_lo <= self.selected_filtered_pos < win_hi:
+            self.caption_view.see(f"{self.selected_filtered_pos - win_lo + 1}.0")
         self.status_var.set(f"Caption text size: {new_size}")
 
     def _seek_relative(self, delta_sec: float) -> None:
@@ -675,39 +1208,100 @@ class TranscriptPlayer:
         self.player.set_time(target_ms)
 
     def _tick_ui(self) -> None:
-        state = self.player.get_state()
-        pos_ms = max(0, self.player.get_time())
-        pos_sec = pos_ms / 1000.0
-        length_ms = self.player.get_length()
+        # Nothing is visible while minimized; skip the render work entirely
+        # and keep a slow heartbeat so the tick resumes on deiconify.
+        try:
+            iconic = self.root.state() == "iconic"
+        except tk.TclError:
+            return
+        if iconic:
+            self.root.after(1000, self._tick_ui)
+            return
+        state, pos_ms, length_ms = self._player_snapshot
+        pos_sec = max(0, pos_ms) / 1000.0
         length_sec = max(0.0, length_ms / 1000.0) if length_ms and length_ms > 0 else 0.0
-        self.clock_var.set(self._render_time_progress(pos_sec, length_sec))
-        self.caption_now_var.set(self._caption_text_at(pos_sec))
+        # Every StringVar.set is a Tcl write that fires traces and relayout;
+        # only write the vars whose rendered text actually changed this tick.
+        clock_text = self._render_time_progress(pos_sec, length_sec)
+        if clock_text != self._last_clock_text:
+            self._last_clock_text = clock_text
+            self.clock_var.set(clock_text)
+        caption_text = self._caption_text_at(pos_sec)
+        if caption_text != self._last_caption_text:
+            self._last_caption_text = caption_text
+            self.caption_now_var.set(caption_text)
         if state == vlc.State.Playing:
-            self.status_var.set(f"Playing @ {_fmt_hms(pos_sec)}")
-        self.root.after(250, self._tick_ui)
+            status_text = f"Playing @ {_fmt_hms(pos_sec)}"
+            if status_text != self.status_var.get():
+                self.status_var.set(status_text)
+            interval = 250
+        elif state == vlc.State.Paused:
+            # Nothing moves while paused/idle; tick slower and let the next
+            # play state restore the 250ms cadence within one interval.
+            interval = 1000
+        else:
+            interval = 1000
+        self.root.after(interval, self._tick_ui)
 
     def _caption_text_at(self, pos_sec: float) -> str:
-        if not self.segments:
+        starts = self._starts
+        n = len(starts)
+        if not n:
             return ""
-        idx = bisect_right(self._segment_starts, pos_sec) - 1
-        if idx < 0 or idx >= len(self.segments):
+        # Playback is monotonic, so between ticks the answer is almost
+        # always "same segment" or "the next one"; check those two in O(1)
+        # and only bisect after a seek breaks the pattern.
+        idx = self._last_caption_idx
+        if not (
+            0 <= idx < n
+            and starts[idx] <= pos_sec
+            and (idx + 1 >= n or pos_sec < starts[idx + 1])
+        ):
+            nxt = idx + 1
+            if (
+                0 <= nxt < n
+                and starts[nxt] <= pos_sec
+                and (nxt + 1 >= n or pos_sec < starts[nxt + 1])
+            ):
+                idx = nxt
+            else:
+                idx = bisect_right(starts, pos_sec) - 1
+        self._last_caption_idx = idx
+        if idx < 0:
             return ""
-        seg = self.segments[idx]
-        if seg.start_sec <= pos_sec <= seg.end_sec:
-            return seg.text
+        if starts[idx] <= pos_sec <= self._ends[idx]:
+            return self._texts[idx]
         return ""
 
     def _render_time_progress(self, pos_sec: float, length_sec: float) -> str:
-        bar_width = self._progress_bar_width
+        bar_width = min(self._progress_bar_width, self._BAR_MAX)
+        ts = _fmt_hms(pos_sec)
         if length_sec <= 0:
-            return f"[{_fmt_hms(pos_sec)}] {'░' * bar_width}"
-        ratio = max(0.0, min(1.0, pos_sec / length_sec))
-        filled = int(round(ratio * bar_width))
-        bar = ("█" * filled) + ("░" * (bar_width - filled))
-        return f"[{_fmt_hms(pos_sec)}] {bar}"
+            filled = 0
+        else:
+            ratio = max(0.0, min(1.0, pos_sec / length_sec))
+            filled = int(round(ratio * bar_width))
+        if self._clock_cache_key == (ts, filled, bar_width):
+            return self._clock_cache_text
+        rendered = f"[{ts}] {self._BAR_FULL[:filled]}{self._BAR_EMPTY[:bar_width - filled]}"
+        self._clock_cache_key = (ts, filled, bar_width)
+        self._clock_cache_text = rendered
+        return rendered
 
     def _on_left_resize(self, event: tk.Event[tk.Misc]) -> None:
         width = int(getattr(event, "width", 0))
+        if width <= 0:
+            return
+        # <Configure> fires once per pixel during a sash drag; remember the
+        # latest width and reconfigure once the drag pauses.
+        self._pending_left_width = width
+        if self._resize_after_id is not None:
+            self.root.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.root.after(80, self._apply_left_resize)
+
+    def _apply_left_resize(self) -> None:
+        self._resize_after_id = None
+        width = self._pending_left_width
         if width <= 0:
             return
         # Keep caption wrapping inside the left panel with padding.
@@ -720,17 +1314,15 @@ class TranscriptPlayer:
             return
         available_px = max(120, width - 24)
         # Prefix is fixed-width and the bar uses mono block chars.
-        prefix_px = self._text_font.measure("[00:00:00] ")
-        block_px =  max(1, self._text_font.measure("█"))
-        bar_chars = max(12, min(140, int((available_px - prefix_px) / block_px)))
+        bar_chars = max(12, min(140, int((available_px - self._prefix_px) / self._block_px)))
         self._progress_bar_width = bar_chars + 24
 
     def _refresh_clock_now(self) -> None:
-        pos_ms = max(0, self.player.get_time())
-        pos_sec = pos_ms / 1000.0
-        length_ms = self.player.get_length()
+        _state, pos_ms, length_ms = self._player_snapshot
+        pos_sec = max(0, pos_ms) / 1000.0
         length_sec = max(0.0, length_ms / 1000.0) if length_ms and length_ms > 0 else 0.0
-        self.clock_var.set(self._render_time_progress(pos_sec, length_sec))
+        self._last_clock_text = self._render_time_progress(pos_sec, length_sec)
+        self.clock_var.set(self._last_clock_text)
 
     def _set_initial_split_ratio(self) -> None:
         if self._split_initialized:
@@ -741,6 +1333,9 @@ class TranscriptPlayer:
         x = int(total_w * 3 / 5)
         self.shell.sash_place(0, x, 0)
         self._split_initialized = True
+        # The <Configure> binding only exists to catch the first real map;
+        # dropping it stops every later resize from re-entering this path.
+        self.shell.unbind("<Configure>")
 
     def _on_shell_configure(self, _event: tk.Event[tk.Misc]) -> None:
         if not self._split_initialized:
@@ -759,7 +1354,7 @@ class TranscriptPlayer:
         return "break"
 
     def _on_toggle_jobs_popup(self, _event: tk.Event[tk.Misc]) -> str:
-        if self._jobs_popup and self._jobs_popup.winfo_exists():
+        if self._jobs_popup is not None and self._jobs_popup.winfo_viewable():
             self._close_jobs_popup()
         else:
             self._open_jobs_popup()
@@ -804,281 +1399,289 @@ class TranscriptPlayer:
         popup.configure(bg="#111111")
         popup.transient(self.root)
 
-    def _open_search_popup(self) -> None:
-        if self._search_popup and self._search_popup.winfo_exists():
-            self._search_popup.focus_force()
-            return
+    def _await_future(
+        self,
+        fut: Future[Any],
+        on_done: Callable[[Any, Exception | None], None],
+        *,
+        poll_ms: int = 50,
+    ) -> None:
+        """Poll a Future from the Tk loop and hand its outcome to on_done.
 
-        popup = tk.Toplevel(self.root)
-        self._apply_popup_style(popup, "Search DB", "900x620")
-        self._search_popup = popup
-        popup.rowconfigure(2, weight=1)
-        popup.columnconfigure(0, weight=1)
+        on_done receives (result, None) on success or (None, exc) on
+        failure, always on the Tk thread.
+        """
 
-        query_var = tk.StringVar(value=self.filter_var.get().strip())
-        query_entry = ttk.Entry(popup, textvariable=query_var, style="Filter.TEntry")
-        query_entry.grid(row=0, column=0, sticky="ew", padx=8, pady=(8, 6))
+        def poll() -> None:
+            if not fut.done():
+                self.root.after(poll_ms, poll)
+                return
+            try:
+                result = fut.result()
+            except Exception as exc:
+                on_done(None, exc)
+                return
+            on_done(result, None)
 
-        header = tk.Label(
-            popup,
-            text="Matches  Title (matches = number of matching caption segments)",
-            anchor="w",
-            bg="#0d0d0d",
-            fg="#8f8f8f",
-            font=(FONT["STYLE"], FONT["SIZE"] - 3),
-            padx=8,
-            pady=4,
-        )
-        header.grid(row=1, column=0, sticky="ew", padx=8, pady=(0, 4))
+        self.root.after(poll_ms, poll)
 
-        body = tk.Frame(popup, bg="#111111")
-        body.grid(row=2, column=0, sticky="nsew", padx=8, pady=(0, 8))
-        body.rowconfigure(0, weight=1)
-        body.columnconfigure(1, weight=1)
+    def _cached_popup_rows(
+        self,
+        kind: str,
+        query: str,
+        fetch: Callable[[str], list[dict[str, Any]]],
+    ) -> list[dict[str, Any]]:
+        # Typed prefixes revisit the same queries constantly ("bat" -> "ba"
+        # on backspace); keep the materialized rows so those hit memory
+        # instead of SQLite. Cleared on popup open so results stay fresh.
+        key = (kind, query)
+        cached = self._popup_query_cache.get(key)
+        if cached is not None:
+            return cached
+        rows = fetch(query)
+        if len(self._popup_query_cache) >= 64:
+            self._popup_query_cache.pop(next(iter(self._popup_query_cache)))
+        self._popup_query_cache[key] = rows
+        return rows
 
-        count_list = tk.Listbox(
-            body,
-            bg="#000000",
-            fg="#f7d154",
-            selectbackground="#161616",
-            selectforeground="#f7d154",
-            activestyle="none",
-            borderwidth=0,
-            highlightthickness=0,
-            width=8,
-            font=(FONT["STYLE"], FONT["SIZE"] - 2, "bold"),
-            exportselection=False,
-            takefocus=0,
-        )
-        title_list = tk.Listbox(
-            body,
-            bg="#000000",
-            fg="#ffffff",
-            selectbackground="#161616",
-            selectforeground="#ffffff",
-            activestyle="none",
-            borderwidth=0,
-            highlightthickness=0,
-            font=(FONT["STYLE"], FONT["SIZE"] - 2),
-            exportselection=False,
+    def _open_search_popup(self) -> None:
+        self._open_result_picker_popup(
+            title="Search DB",
+            header="Matches  Title (matches = number of matching caption segments)",
+            hint="Type query, Up/Down select, Enter open video, Esc close",
+            popup_attr="_search_popup",
+            reopen_attr="_search_popup_reopen",
+            after_attr="_search_after_id",
+            storage_attr="_search_results",
+            fetch=self._fetch_search_rows,
+            initial_query=lambda: self.filter_var.get().strip(),
+            session_start=lambda row, query: (
+                float(int(row.get("first_start_ms") or 0)) / 1000.0,
+                query,
+            ),
         )
-        count_list.grid(row=0, column=0, sticky="ns")
-        title_list.grid(row=0, column=1, sticky="nsew")
 
-        hint = tk.Label(
-            popup,
-            text="Type query, Up/Down select, Enter open video, Esc close",
-            anchor="w",
-            bg="#0d0d0d",
-            fg="#8f8f8f",
-            font=(FONT["STYLE"], FONT["SIZE"] - 3),
-            padx=8,
-            pady=6,
+    def _open_video_picker_popup(self) -> None:
+        self._open_result_picker_popup(
+            title="Open Video",
+            header="Matches  Title (matches = number of title matches)",
+            hint="Type title filter, Up/Down select, Enter open video, Esc close",
+            popup_attr="_video_picker_popup",
+            reopen_attr="_picker_popup_reopen",
+            after_attr="_picker_after_id",
+            storage_attr="_video_picker_results",
+            fetch=self._fetch_picker_rows,
+            initial_query=lambda: "",
+            session_start=lambda row, query: (0.0, ""),
+            on_reset=self._reset_title_corpus,
         )
-        hint.grid(row=3, column=0, sticky="ew")
 
-        def _set_selection(idx: int) -> None:
-            if not self._search_results:
-                return
-            idx = max(0, min(idx, len(self._search_results) - 1))
-            for lb in (count_list, title_list):
-                lb.selection_clear(0, tk.END)
-                lb.selection_set(idx)
-                lb.activate(idx)
-                lb.see(idx)
+    def _reset_title_corpus(self) -> None:
+        self._title_lower = None
 
-        def refresh_results(*_args: object) -> None:
-            query = query_var.get().strip()
-            count_list.delete(0, tk.END)
-            title_list.delete(0, tk.END)
-            self._search_results = []
-            if not query:
-                return
-            rows = self.ingester.search_videos(query, limit=200)
-            self._search_results = [dict(r) for r in rows]
-            for row in self._search_results:
-                title = str(
-                    row.get("title") \
-                    or row.get("video_id") \
-                    or "untitled"
-                ).replace("\n", " ").strip()
-                count = int(row.get("match_count") or 0)
-                count_list.insert(tk.END, f"{count:>4}")
-                title_list.insert(tk.END, title)
-            if self._search_results:
-                _set_selection(0)
+    def _fetch_search_rows(self, query: str) -> list[dict[str, Any]]:
+        if not query:
+            return []
+        return self._cached_popup_rows(
+            "search", query, lambda q: self.ingester.search_videos(q, limit=200)
+        )
 
-        def open_selected(_event: tk.Event[tk.Misc] | None = None) -> str:
-            sel = title_list.curselection()
-            if not sel:
-                return "break"
-            idx = int(sel[0])
-            if idx < 0 or idx >= len(self._search_results):
-                return "break"
-            row = self._search_results[idx]
-            query = query_var.get().strip()
-            video_id = str(row.get("video_id") or "")
-            transcript_path = Path(str(row.get("transcript_json_path") or ""))
-            preferred = Path(str(row.get("local_video_path") or "")) if row.get("local_video_path") else None
-            if not transcript_path.exists():
-                self.status_var.set(f"Missing transcript for {video_id}")
-                return "break"
-            try:
-                video_path = resolve_playback_media_path(
-                    self.ingester_config,
-                    video_id=video_id,
-                    preferred_path=preferred,
-                )
-            except Exception as exc:
-                self.status_var.set(f"Playback path error: {exc}")
-                return "break"
-            audio_path = self._find_audio_sidecar(video_id, video_path)
-            start_sec = float(int(row.get("first_start_ms") or 0)) / 1000.0
-            self._load_session(
-                video_id =video_id,
-                transcript_json = transcript_path,
-                video_path = video_path,
-                audio_path = audio_path,
-                start_sec = start_sec,
-                filter_text = query,
+    def _fetch_picker_rows(self, query: str) -> list[dict[str, Any]]:
+        if not query:
+            return self._cached_popup_rows(
+                "picker", query, lambda q: self.ingester.search_video_titles(q, limit=300)
             )
-            popup.destroy()
-            self._search_popup = None
-            self.filter_entry.focus_set()
-            return "break"
-
-        def move_sel(delta: int) -> str:
-            sel = title_list.curselection()
-            cur = int(sel[0]) if sel else 0
-            _set_selection(cur + delta)
-            return "break"
-
-        query_var.trace_add("write", refresh_results)
-        popup.bind("<Escape>", lambda _e: (popup.destroy(), self.filter_entry.focus_set()))
-        popup.bind("<Return>", open_selected)
-        popup.bind("<Up>", lambda _e: move_sel(-1))
-        popup.bind("<Down>", lambda _e: move_sel(1))
-        query_entry.bind("<Up>", lambda _e: move_sel(-1))
-        query_entry.bind("<Down>", lambda _e: move_sel(1))
-        title_list.bind("<Up>", lambda _e: move_sel(-1))
-        title_list.bind("<Down>", lambda _e: move_sel(1))
-        title_list.bind("<Double-Button-1>", open_selected)
-        count_list.bind("<Button-1>", lambda _e: "break")
-        popup.protocol("WM_DELETE_WINDOW", lambda: (popup.destroy(), self.filter_entry.focus_set()))
-        refresh_results()
-        query_entry.focus_set()
+        # Title filtering happens against an in-memory lowered copy of the
+        # library, skipping the DB round trip entirely; the corpus is
+        # rebuilt once per popup open.
+        if self._title_lower is None:
+            self._title_lower = [
+                (str(r.get("title") or r.get("video_id") or "").lower(), r)
+                for r in self.ingester.list_video_titles()
+            ]
+        q = query.lower()
+        rows: list[dict[str, Any]] = []
+        for lowered, r in self._title_lower:
+            n = lowered.count(q)
+            if n:
+                hit = dict(r)
+                hit["match_count"] = n
+                rows.append(hit)
+                if len(rows) >= 300:
+                    break
+        return rows
 
-    def _open_video_picker_popup(self) -> None:
-        if self._video_picker_popup and \
-            self._video_picker_popup.winfo_exists():
-            self._video_picker_popup.focus_force()
+    def _open_result_picker_popup(
+        self,
+        *,
+        title: str,
+        header: str,
+        hint: str,
+        popup_attr: str,
+        reopen_attr: str,
+        after_attr: str,
+        storage_attr: str,
+        fetch: Callable[[str], list[dict[str, Any]]],
+        initial_query: Callable[[], str],
+        session_start: Callable[[dict[str, Any], str], tuple[float, str]],
+        on_reset: Callable[[], None] | None = None,
+    ) -> None:
+        """Build (or reopen) one of the two result-picker popups.
+
+        The search and video-picker popups share their entire layout and
+        closure family; they differ only in how rows are fetched, how the
+        chosen row maps to (start_sec, filter_text) via session_start,
+        and which *_attr names hold the per-popup state. Popups are built
+        once and toggled with withdraw/deiconify, so reopening skips the
+        widget construction entirely.
+        """
+        existing: tk.Toplevel | None = getattr(self, popup_attr)
+        if existing and existing.winfo_exists():
+            reopen_cb: Callable[[], None] | None = getattr(self, reopen_attr)
+            if reopen_cb:
+                reopen_cb()
             return
 
         popup = tk.Toplevel(self.root)
-        self._apply_popup_style(popup, "Open Video", "900x620")
-        self._video_picker_popup = popup
+        self._apply_popup_style(popup, title, "900x620")
+        setattr(self, popup_attr, popup)
+        self._popup_query_cache.clear()
+        if on_reset:
+            on_reset()
         popup.rowconfigure(2, weight=1)
         popup.columnconfigure(0, weight=1)
 
-        query_var = tk.StringVar(value="")
+        query_var = tk.StringVar(value=initial_query())
         query_entry = ttk.Entry(popup, textvariable=query_var, style="Filter.TEntry")
         query_entry.grid(row=0, column=0, sticky="ew", padx=8, pady=(8, 6))
 
-        header = tk.Label(
-            popup,
-            text="Matches  Title (matches = number of title matches)",
-            anchor="w",
-            bg="#0d0d0d",
-            fg="#8f8f8f",
-            font=(FONT["STYLE"], FONT["SIZE"] - 3),
-            padx=8,
-            pady=4,
-        )
-        header.grid(row=1, column=0, sticky="ew", padx=8, pady=(0, 4))
+        header_lbl = _hint_label(popup, header)
+        header_lbl.grid(row=1, column=0, sticky="ew", padx=8, pady=(0, 4))
 
         body = tk.Frame(popup, bg="#111111")
         body.grid(row=2, column=0, sticky="nsew", padx=8, pady=(0, 8))
         body.rowconfigure(0, weight=1)
         body.columnconfigure(1, weight=1)
 
-        count_list = tk.Listbox(
-            body,
-            bg="#000000",
-            fg="#f7d154",
-            selectbackground="#161616",
-            selectforeground="#f7d154",
-            activestyle="none",
-            borderwidth=0,
-            highlightthickness=0,
-            width=8,
-            font=(FONT["STYLE"], FONT["SIZE"] - 2, "bold"),
-            exportselection=False,
-            takefocus=0,
-        )
-        title_list = tk.Listbox(
-            body,
-            bg="#000000",
-            fg="#ffffff",
-            selectbackground="#161616",
-            selectforeground="#ffffff",
-            activestyle="none",
-            borderwidth=0,
-            highlightthickness=0,
-            font=(FONT["STYLE"], FONT["SIZE"] - 2),
-            exportselection=False,
+        # listvariable-backed Listboxes: replacing the realized rows is a
+        # single Variable.set -> one Tcl call and one deferred redraw,
+        # instead of delete/insert pairs.
+        count_var = tk.Variable(popup, value=())
+        title_var = tk.Variable(popup, value=())
+        count_list = _result_listbox(
+            body, bold=True, width=8, fg="#f7d154", takefocus=False, listvariable=count_var
         )
+        title_list = _result_listbox(body, listvariable=title_var)
         count_list.grid(row=0, column=0, sticky="ns")
         title_list.grid(row=0, column=1, sticky="nsew")
 
-        hint = tk.Label(
-            popup,
-            text="Type title filter, Up/Down select, Enter open video, Esc close",
-            anchor="w",
-            bg="#0d0d0d",
-            fg="#8f8f8f",
-            font=(FONT["STYLE"], FONT["SIZE"] - 3),
-            padx=8,
-            pady=6,
-        )
-        hint.grid(row=3, column=0, sticky="ew")
+        hint_lbl = _hint_label(popup, hint, pady=6)
+        hint_lbl.grid(row=3, column=0, sticky="ew")
 
-        def _set_selection(idx: int) -> None:
-            if not self._video_picker_results:
+        page: dict[str, Any] = {"counts": [], "titles": [], "inserted": 0}
+        sel_pending: dict[str, int | None] = {"idx": None}
+        last_query: dict[str, str | None] = {"q": None}
+        fetch_gen = {"n": 0}
+
+        def _extend_visible() -> None:
+            lo = page["inserted"]
+            hi = min(lo + self._POPUP_PAGE, len(page["titles"]))
+            if hi <= lo:
+                return
+            count_var.set(tuple(page["counts"][:hi]))
+            title_var.set(tuple(page["titles"][:hi]))
+            page["inserted"] = hi
+
+        def _on_list_scroll(first: str, last: str) -> None:
+            # Only the visible page is realized; stream in the next one as
+            # the user nears the bottom of what has been inserted so far.
+            if float(last) > 0.9 and page["inserted"] < len(page["titles"]):
+                _extend_visible()
+
+        def _apply_selection() -> None:
+            idx = sel_pending["idx"]
+            sel_pending["idx"] = None
+            if idx is None or not popup.winfo_exists():
                 return
-            idx = max(0, min(idx, len(self._video_picker_results) - 1))
             for lb in (count_list, title_list):
                 lb.selection_clear(0, tk.END)
                 lb.selection_set(idx)
                 lb.activate(idx)
                 lb.see(idx)
 
+        def _set_selection(idx: int) -> None:
+            results = getattr(self, storage_attr)
+            if not results:
+                return
+            idx = max(0, min(idx, len(results) - 1))
+            while page["inserted"] <= idx:
+                _extend_visible()
+            # Defer the six selection calls to idle time so bursts (e.g.
+            # refresh + key repeat) flush in one paint cycle.
+            schedule = sel_pending["idx"] is None
+            sel_pending["idx"] = idx
+            if schedule:
+                self.root.after_idle(_apply_selection)
+
         def refresh_results(*_args: object) -> None:
             query = query_var.get().strip()
-            count_list.delete(0, tk.END)
-            title_list.delete(0, tk.END)
-            self._video_picker_results = []
-            rows = self.ingester.search_video_titles(query, limit=300)
-            self._video_picker_results = [dict(r) for r in rows]
-            for row in self._video_picker_results:
-                title = str(
-                    row.get("title") \
-                    or row.get("video_id") \
-                    or "untitled"
-                ).replace("\n", " ").strip()
-                count = int(row.get("match_count") or 0)
-                count_list.insert(tk.END, f"{count:>4}")
-                title_list.insert(tk.END, title)
-            if self._video_picker_results:
+            # Whitespace edits and equal rewrites (cut+paste, the reopen
+            # trace echo) normalize to the same query; nothing to redo.
+            if query == last_query["q"]:
+                return
+            last_query["q"] = query
+            # The fetch can hit SQLite (or rebuild the title corpus); run it
+            # on the executor so typing never blocks on the query. Each
+            # submit bumps the generation, and stale deliveries are dropped
+            # so a slow early query cannot overwrite a later one's rows.
+            fetch_gen["n"] += 1
+            gen = fetch_gen["n"]
+            fut = self._url_executor.submit(fetch, query)
+            self._await_future(
+                fut, lambda rows, exc: deliver_results(gen, rows, exc), poll_ms=20
+            )
+
+        def deliver_results(
+            gen: int, rows: list[dict[str, Any]] | None, exc: Exception | None
+        ) -> None:
+            if gen != fetch_gen["n"] or not popup.winfo_exists():
+                return
+            if exc is not None or rows is None:
+                # Let an identical retype retry instead of short-circuiting.
+                last_query["q"] = None
+                self.status_var.set(f"Search failed: {exc}")
+                return
+            # The DB layer already hands back plain dicts; keep them as-is
+            # rather than re-materializing a copy per row per keystroke.
+            setattr(self, storage_attr, list(rows))
+            # One comprehension pass per column; the Listboxes then get the
+            # fully formatted strings in bulk.
+            titles = [_display_title(row.get("title"), row.get("video_id")) for row in rows]
+            counts = [f"{row['match_count']:>4}" for row in rows]
+            page["counts"] = counts
+            page["titles"] = titles
+            page["inserted"] = 0
+            if counts:
+                _extend_visible()
                 _set_selection(0)
+            else:
+                count_var.set(())
+                title_var.set(())
 
         def open_selected(_event: tk.Event[tk.Misc] | None = None) -> str:
-            sel = title_list.curselection()
-            if not sel:
-                return "break"
-            idx = int(sel[0])
-            if idx < 0 or idx >= len(self._video_picker_results):
+            pending = sel_pending["idx"]
+            if pending is not None:
+                idx = pending
+            else:
+                sel = title_list.curselection()
+                if not sel:
+                    return "break"
+                idx = int(sel[0])
+            results = getattr(self, storage_attr)
+            if idx < 0 or idx >= len(results):
                 return "break"
-            row = self._video_picker_results[idx]
+            row = results[idx]
+            query = query_var.get().strip()
             video_id = str(row.get("video_id") or "")
             transcript_path = Path(str(row.get("transcript_json_path") or ""))
             preferred = Path(str(row.get("local_video_path") or "")) if row.get("local_video_path") else None
@@ -1095,27 +1698,61 @@ class TranscriptPlayer:
                 self.status_var.set(f"Playback path error: {exc}")
                 return "break"
             audio_path = self._find_audio_sidecar(video_id, video_path)
+            start_sec, filter_text = session_start(row, query)
             self._load_session(
                 video_id=video_id,
                 transcript_json=transcript_path,
                 video_path=video_path,
                 audio_path=audio_path,
-                start_sec=0.0,
-                filter_text="",
+                start_sec=start_sec,
+                filter_text=filter_text,
             )
-            popup.destroy()
-            self._video_picker_popup = None
+            popup.withdraw()
             self.filter_entry.focus_set()
             return "break"
 
         def move_sel(delta: int) -> str:
-            sel = title_list.curselection()
-            cur = int(sel[0]) if sel else 0
+            pending = sel_pending["idx"]
+            if pending is not None:
+                cur = pending
+            else:
+                sel = title_list.curselection()
+                cur = int(sel[0]) if sel else 0
             _set_selection(cur + delta)
             return "break"
 
-        query_var.trace_add("write", refresh_results)
-        popup.bind("<Escape>", lambda _e: (popup.destroy(), self.filter_entry.focus_set()))
+        def run_refresh() -> None:
+            setattr(self, after_attr, None)
+            if popup.winfo_exists():
+                refresh_results()
+
+        def schedule_refresh(*_args: object) -> None:
+            # Coalesce keystroke bursts into one query once typing pauses,
+            # mirroring the _on_filter_change debounce.
+            after_id = getattr(self, after_attr)
+            if after_id is not None:
+                self.root.after_cancel(after_id)
+            setattr(self, after_attr, self.root.after(150, run_refresh))
+
+        def hide(*_args: object) -> None:
+            popup.withdraw()
+            self.filter_entry.focus_set()
+
+        def reopen() -> None:
+            self._popup_query_cache.clear()
+            if on_reset:
+                on_reset()
+            last_query["q"] = None
+            popup.deiconify()
+            popup.focus_force()
+            query_var.set(initial_query())
+            refresh_results()
+            query_entry.focus_set()
+
+        setattr(self, reopen_attr, reopen)
+        query_var.trace_add("write", schedule_refresh)
+        title_list.configure(yscrollcommand=_on_list_scroll)
+        popup.bind("<Escape>", hide)
         popup.bind("<Return>", open_selected)
         popup.bind("<Up>", lambda _e: move_sel(-1))
         popup.bind("<Down>", lambda _e: move_sel(1))
@@ -1125,13 +1762,14 @@ class TranscriptPlayer:
         title_list.bind("<Down>", lambda _e: move_sel(1))
         title_list.bind("<Double-Button-1>", open_selected)
         count_list.bind("<Button-1>", lambda _e: "break")
-        popup.protocol("WM_DELETE_WINDOW", lambda: (popup.destroy(), self.filter_entry.focus_set()))
+        popup.protocol("WM_DELETE_WINDOW", hide)
         refresh_results()
         query_entry.focus_set()
 
     def _open_ingest_popup(self) -> None:
         if self._ingest_popup and self._ingest_popup.winfo_exists():
-            self._ingest_popup.focus_force()
+            if self._ingest_popup_reopen:
+                self._ingest_popup_reopen()
             return
 
         popup = tk.Toplevel(self.root)
@@ -1150,53 +1788,100 @@ class TranscriptPlayer:
             anchor="w",
             bg="#0d0d0d",
             fg="#8f8f8f",
-            font=(FONT["STYLE"], FONT["SIZE"] - 2),
+            font=LIST_FONT,
             padx=8,
             pady=6,
         )
         status_lbl.grid(row=1, column=0, sticky="ew", padx=8, pady=(0, 8))
         pending_confirm: dict[str, object] = {"video_id": None, "url": None}
+        busy = {"inflight": False}
+
+        def finish_enqueue(result: Any, exc: Exception | None) -> None:
+            busy["inflight"] = False
+            if not popup.winfo_exists():
+                return
+            if exc is not None:
+                status.set(f"Error: {exc}")
+                return
+            ids = list(result.get("queued_ids") or [])
+            if not ids:
+                status.set("Not queued")
+                return
+            status.set(f"Queued job_id={ids[0]}")
+            self.status_var.set(f"Queued ingest job {ids[0]}")
+            url_var.set("")
+
+        def finish_inspect(url: str, info: Any, exc: Exception | None) -> None:
+            if not popup.winfo_exists():
+                busy["inflight"] = False
+                return
+            if exc is not None:
+                busy["inflight"] = False
+                status.set(f"Error: {exc}")
+                return
+            exists = bool(info.get("exists"))
+            video_id = str(info.get("video_id") or "")
+            if exists:
+                if pending_confirm.get("video_id") != video_id or pending_confirm.get("url") != url:
+                    busy["inflight"] = False
+                    pending_confirm["video_id"] = video_id
+                    pending_confirm["url"] = url
+                    title = str(info.get("title") or video_id)
+                    status.set(
+                        f"Exists: {title} ({video_id}). Press Enter again to save over, Esc to cancel."
+                    )
+                    return
+                fut = self._url_executor.submit(
+                    self.ingester.enqueue_with_dedupe, [url], allow_overwrite=True
+                )
+            else:
+                pending_confirm["video_id"] = None
+                pending_confirm["url"] = None
+                fut = self._url_executor.submit(
+                    self.ingester.enqueue_with_dedupe, [url], allow_overwrite=False
+                )
+            status.set("Queueing ...")
+            self._await_future(fut, finish_enqueue)
 
         def enqueue_now(_event: tk.Event[tk.Misc] | None = None) -> str:
             url = url_var.get().strip()
             if not url:
                 status.set("URL required")
                 return "break"
-            try:
-                info = self.ingester.inspect_url(url)
-                exists = bool(info.get("exists"))
-                video_id = str(info.get("video_id") or "")
-                if exists:
-                    if pending_confirm.get("video_id") != video_id or pending_confirm.get("url") != url:
-                        pending_confirm["video_id"] = video_id
-                        pending_confirm["url"] = url
-                        title = str(info.get("title") or video_id)
-                        status.set(
-                            f"Exists: {title} ({video_id}). Press Enter again to save over, Esc to cancel."
-                        )
-                        return "break"
-                    result = self.ingester.enqueue_with_dedupe([url], allow_overwrite=True)
-                else:
-                    pending_confirm["video_id"] = None
-                    pending_confirm["url"] = None
-                    result = self.ingester.enqueue_with_dedupe([url], allow_overwrite=False)
-                ids = list(result.get("queued_ids") or [])
-                if not ids:
-                    status.set("Not queued")
-                    return "break"
-                status.set(f"Queued job_id={ids[0]}")
-                self.status_var.set(f"Queued ingest job {ids[0]}")
-                url_var.set("")
-            except Exception as exc:
-                status.set(f"Error: {exc}")
+            if busy["inflight"]:
+                return "break"
+            busy["inflight"] = True
+            # Inspection hits the network; run it off the mainloop and
+            # continue from the poll callback so the UI stays live.
+            status.set("Inspecting ...")
+            fut = self._url_executor.submit(self.ingester.inspect_url, url)
+            self._await_future(fut, lambda info, exc: finish_inspect(url, info, exc))
             return "break"
 
+        def hide(*_args: object) -> None:
+            popup.withdraw()
+            self.filter_entry.focus_set()
+
+        def reopen() -> None:
+            popup.deiconify()
+            popup.focus_force()
+            url_var.set("")
+            status.set("Enter URL and press Enter")
+            pending_confirm["video_id"] = None
+            pending_confirm["url"] = None
+            entry.focus_set()
+
+        self._ingest_popup_reopen = reopen
         popup.bind("<Return>", enqueue_now)
-        popup.bind("<Escape>", lambda _e: (popup.destroy(), self.filter_entry.focus_set()))
-        popup.protocol("WM_DELETE_WINDOW", lambda: (popup.destroy(), self.filter_entry.focus_set()))
+        popup.bind("<Escape>", hide)
+        popup.protocol("WM_DELETE_WINDOW", hide)
         entry.focus_set()
 
     def _open_jobs_popup(self) -> None:
+        if self._jobs_popup is not None:
+            self._jobs_popup.deiconify()
+            self._refresh_jobs_popup()
+            return
         popup = tk.Toplevel(self.root)
         self._apply_popup_style(popup, "Ingest Jobs", "900x520")
         self._jobs_popup = popup
@@ -1209,7 +1894,7 @@ class TranscriptPlayer:
             fg="#ffffff",
             borderwidth=0,
             highlightthickness=0,
-            font=(FONT["STYLE"], FONT["SIZE"] - 3),
+            font=HEADER_FONT,
             wrap="none",
             padx=8,
             pady=8,
@@ -1220,28 +1905,77 @@ class TranscriptPlayer:
 
         popup.bind("<Escape>", lambda _e: self._close_jobs_popup())
         popup.protocol("WM_DELETE_WINDOW", self._close_jobs_popup)
+        # A just-created (or just-deiconified) toplevel is not mapped yet,
+        # so the synchronous refresh below lands in the hidden-popup branch;
+        # <Map> retriggers it the moment the window actually shows, instead
+        # of waiting out the slow heartbeat.
+        popup.bind(
+            "<Map>",
+            lambda e: self._refresh_jobs_popup() if e.widget is popup else None,
+        )
+        # Teardown is event-driven: the <Destroy> handler clears the widget
+        # references, so the refresh loop checks plain attributes instead of
+        # one winfo_exists() Tcl call per cycle.
+        popup.bind(
+            "<Destroy>",
+            lambda e: self._on_jobs_popup_destroyed() if e.widget is popup else None,
+        )
         self._refresh_jobs_popup()
 
-    def _close_jobs_popup(self) -> None:
+    def _on_jobs_popup_destroyed(self) -> None:
         if self._jobs_after_id:
             try:
                 self.root.after_cancel(self._jobs_after_id)
             except Exception:
                 pass
             self._jobs_after_id = None
-        if self._jobs_popup and self._jobs_popup.winfo_exists():
-            self._jobs_popup.destroy()
         self._jobs_popup = None
         self._jobs_text = None
+        self._jobs_last_payload = None
+
+    def _close_jobs_popup(self) -> None:
+        if self._jobs_after_id:
+            try:
+                self.root.after_cancel(self._jobs_after_id)
+            except Exception:
+                pass
+            self._jobs_after_id = None
+        if self._jobs_popup is not None:
+            self._jobs_popup.withdraw()
         self.filter_entry.focus_set()
 
     def _refresh_jobs_popup(self) -> None:
-        if not self._jobs_popup \
-            or not self._jobs_popup.winfo_exists() \
-            or not self._jobs_text:
+        popup = self._jobs_popup
+        if popup is None or self._jobs_text is None:
             return
-        try:
-            snapshot = self.ingester.jobs_summary(limit=30)
+        if self._jobs_after_id:
+            try:
+                self.root.after_cancel(self._jobs_after_id)
+            except Exception:
+                pass
+            self._jobs_after_id = None
+        if self._jobs_fetch_inflight:
+            return
+        if not popup.winfo_viewable():
+            # Hidden popup: no DB query, just a slow heartbeat so the
+            # refresh loop picks back up when the window is deiconified.
+            self._jobs_after_id = self.root.after(3000, self._refresh_jobs_popup)
+            return
+        # The summary query runs off-thread; the snapshot callback updates
+        # the widget and schedules the next cycle.
+        self._jobs_fetch_inflight = True
+        fut = self._url_executor.submit(self.ingester.jobs_summary, 30)
+        self._await_future(fut, self._on_jobs_snapshot)
+
+    def _on_jobs_snapshot(self, snapshot: Any, exc: Exception | None) -> None:
+        self._jobs_fetch_inflight = False
+        popup = self._jobs_popup
+        text = self._jobs_text
+        if popup is None or text is None:
+            return
+        if exc is not None:
+            payload = f"Failed to load ingest jobs: {exc}"
+        else:
             counts = snapshot.get("counts", {})
             jobs = snapshot.get("jobs", [])
             lines = [
@@ -1251,40 +1985,135 @@ class TranscriptPlayer:
                 f"done={counts.get('done', 0)}  "
                 f"failed={counts.get('failed', 0)}",
                 "",
-                "id    status        video_id       created_at",
+                _JOBS_HEADER,
             ]
-            for row in jobs:
-                lines.append(
-                    f"{str(row.get('id', '')):<5} "
-                    f"{str(row.get('status', '')):<12} "
-                    f"{str(row.get('video_id') or '-'):<13} "
-                    f"{str(row.get('created_at') or '-')}"
+            lines += [
+                _JOBS_ROW.format(
+                    id=row.get("id", ""),
+                    status=row.get("status", ""),
+                    video_id=row.get("video_id") or "-",
+                    created_at=row.get("created_at") or "-",
                 )
+                for row in jobs
+            ]
             payload = "\n".join(lines)
-        except Exception as exc:
-            payload = f"Failed to load ingest jobs: {exc}"
 
-        self._jobs_text.configure(state="normal")
-        self._jobs_text.delete("1.0", tk.END)
-        self._jobs_text.insert("1.0", payload)
-        self._jobs_text.configure(state="disabled")
-        self._jobs_after_id = self.root.after(1000, self._refresh_jobs_popup)
+        # Rewriting the Text widget is the expensive part; skip it when
+        # the queue state has not moved since the last cycle. The poll
+        # cadence adapts to churn: an actual change snaps back to 250ms so
+        # bursts render promptly, while identical snapshots double the
+        # interval up to a 5s cap so an idle queue costs almost nothing.
+        if payload != self._jobs_last_payload:
+            self._jobs_last_payload = payload
+            text.configure(state="normal")
+            text.delete("1.0", tk.END)
+            text.insert("1.0", payload)
+            text.configure(state="disabled")
+            self._jobs_interval_ms = 250
+        else:
+            self._jobs_interval_ms = min(5000, self._jobs_interval_ms * 2)
+        self._jobs_after_id = self.root.after(self._jobs_interval_ms, self._refresh_jobs_popup)
 
     def _find_audio_sidecar(self, video_id: str, video_path: Path) -> Path | None:
-        if _media_has_audio_stream(video_path) is True:
+        try:
+            vstat = video_path.stat()
+        except OSError:
+            vstat = None
+        if (
+            vstat is not None
+            and _probe_audio(str(video_path), vstat.st_mtime_ns, vstat.st_size) is True
+        ):
             return None
-        candidates = sorted(self.ingester_config.media_dir.glob(f"{video_id}*"))
-        audio_only: list[Path] = []
-        for p in candidates:
-            if not p.is_file() or p == video_path:
+        # Once the background index is built, resolution is a dict lookup.
+        # A miss is not authoritative: videos ingested after the index was
+        # built are not in it, so fall through to the on-disk probes and
+        # cache any hit back into the index.
+        index = self._sidecar_index
+        if index is not None:
+            found = index.get(video_id)
+            if found is not None:
+                return found if found != video_path else None
+        # Cold start (index not yet published): the pipeline writes sidecars
+        # under conventional audio extensions, so stat those exact names
+        # first and only fall back to scanning the directory when none fit.
+        media_dir = self.ingester_config.media_dir
+        for ext in _AUDIO_SIDECAR_EXTS:
+            cand = media_dir / f"{video_id}{ext}"
+            if cand == video_path:
+                continue
+            try:
+                st = cand.stat()
+            except OSError:
                 continue
-            has_audio = _media_has_audio_stream(p)
-            has_video = _media_has_video_stream(p)
-            if has_audio is True and has_video is False:
-                audio_only.append(p)
+            cand_str = str(cand)
+            if (
+                _probe_audio(cand_str, st.st_mtime_ns, st.st_size) is True
+                and _probe_video(cand_str, st.st_mtime_ns, st.st_size) is False
+            ):
+                if index is not None:
+                    index[video_id] = cand
+                return cand
+        # One scandir pass: DirEntry carries the stat info, so no extra
+        # syscalls per candidate and no filename sort of the full match set.
+        audio_only: list[tuple[Path, int]] = []
+        try:
+            with os.scandir(self.ingester_config.media_dir) as it:
+                for entry in it:
+                    if not entry.name.startswith(video_id):
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    p = Path(entry.path)
+                    if p == video_path:
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    # Audio-less files skip the second probe entirely.
+                    if _probe_audio(entry.path, st.st_mtime_ns, st.st_size) is not True:
+                        continue
+                    if _probe_video(entry.path, st.st_mtime_ns, st.st_size) is False:
+                        audio_only.append((p, st.st_size))
+        except OSError:
+            return None
         if not audio_only:
             return None
-        return sorted(audio_only, key=lambda p: p.stat().st_size, reverse=True)[0]
+        best = max(audio_only, key=lambda ps: ps[1])[0]
+        if index is not None:
+            index[video_id] = best
+        return best
+
+    def _build_sidecar_index(self) -> None:
+        """Scan the media dir once and map video_id -> best audio sidecar.
+
+        Runs on a worker thread at startup; the finished dict is published
+        atomically, flipping _find_audio_sidecar from per-open directory
+        scans and probes to a single lookup. Media files are written as
+        "<video_id>.<...>", so the stem up to the first dot is the id.
+        """
+        best: dict[str, tuple[Path, int]] = {}
+        try:
+            with os.scandir(self.ingester_config.media_dir) as it:
+                entries = [e for e in it if e.is_file(follow_symlinks=False)]
+        except OSError:
+            return
+        for entry in entries:
+            video_id = entry.name.split(".", 1)[0]
+            if not video_id:
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            if _probe_audio(entry.path, st.st_mtime_ns, st.st_size) is not True:
+                continue
+            if _probe_video(entry.path, st.st_mtime_ns, st.st_size) is not False:
+                continue
+            cur = best.get(video_id)
+            if cur is None or st.st_size > cur[1]:
+                best[video_id] = (Path(entry.path), st.st_size)
+        self._sidecar_index = {vid: path for vid, (path, _size) in best.items()}
 
     def _load_session(
         self,
@@ -1300,27 +2129,32 @@ class TranscriptPlayer:
         self._load_fail_count = 0
         self._proxy_attempted = False
         self.transcript_json = transcript_json
-        self.segments = self._load_segments(transcript_json)
-        self._segment_starts = [seg.start_sec for seg in self.segments]
-        self.filtered_indexes = list(range(len(self.segments)))
+        self._load_segments(transcript_json)
+        self.filtered_indexes = array("i", range(len(self._texts)))
+        self._filtered_starts = self._starts[:]
         self.selected_filtered_pos = 0
+        self._last_filter_query = ""
+        self._last_caption_idx = -1
+        self._filter_cache.clear()
         self._set_player_media(video_path, audio_path, start_sec=start_sec)
+        # The write trace on filter_var rebuilds the caption view exactly once,
+        # even for an empty filter; selection moves after that only re-apply
+        # the selected/selected_txt tags via _select_pos.
         self.filter_var.set(filter_text)
-        if not filter_text:
-            self._refresh_caption_view()
         self.status_var.set(f"Loaded video at {_fmt_hms(start_sec)}")
 
     def close(self) -> None:
         self._close_jobs_popup()
-        if self._search_popup and \
-            self._search_popup.winfo_exists():
-            self._search_popup.destroy()
-        if self._video_picker_popup and \
-            self._video_picker_popup.winfo_exists():
-            self._video_picker_popup.destroy()
-        if self._ingest_popup and \
-            self._ingest_popup.winfo_exists():
-            self._ingest_popup.destroy()
+        for popup in (
+            self._jobs_popup,
+            self._search_popup,
+            self._video_picker_popup,
+            self._ingest_popup,
+        ):
+            if popup and popup.winfo_exists():
+                popup.destroy()
+        self._player_poll_stop.set()
+        self._url_executor.shutdown(wait=False)
         try:
             self.ingester.stop_background_workers()
             self.player.stop()
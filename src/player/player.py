@@ -1,10 +1,18 @@
 from pathlib import Path
 from typing import Any, TYPE_CHECKING
 from dataclasses import dataclass
+from array import array
+from bisect import bisect_right
 import tkinter as tk
 from tkinter import ttk
 import sys
 import json
+import re
+
+try:
+    import orjson
+except ImportError:  # optional fast path; stdlib json is the fallback
+    orjson = None
 
 from theme import Colorscheme, Geometry, Theme, Font
 
@@ -12,11 +20,18 @@ if TYPE_CHECKING: from vlc import State
 
 @dataclass(slots=True)
 class SegmentRow:
-    idx:     int
-    start:   float
-    end:     float
-    text:    str
-    text_lc: str
+    idx:       int
+    start:     float
+    end:       float
+    text:      str
+    text_lc:   str
+    # UTF-8 copy of text_lc: bytes.find/__contains__ run the C fast path
+    # for existence checks; char-indexed work (tag positions) stays on the
+    # str column
+    text_lc_b: bytes
+    # "[HH:MM:SS] " display prefix, formatted once at load instead of per
+    # rendered row per refresh
+    prefix:    str
 
 def _fmt_hms(seconds: float) -> str:
     total = max(0, int(seconds))
@@ -26,6 +41,10 @@ def _fmt_hms(seconds: float) -> str:
     return f"{h:02d}:{m:02d}:{s:02d}"
 
 class Player:
+    # rows rendered above/below the cursor in the caption list; the rest
+    # stream in as scrolling approaches a window edge
+    RENDER_OVERSCAN = 250
+
     def __init__(
         self,
         transcript: Path | None = None,
@@ -43,14 +62,31 @@ class Player:
         self.workers = max(0, int(workers))
 
         # caption list values
-        self.caption_seg_starts:      list[float] = []
+        # start times as packed C doubles: dense storage and bisect-friendly
+        # for the playback-position lookup in _segment_at
+        self.caption_seg_starts = array('d')
         self.caption_segments:        list[SegmentRow] = []
         self.caption_row_ranges:      list[tuple[str, str]] = []
         self.caption_row_text_ranges: list[tuple[str, str]] = []
+        # None means "no filter": filtered_indexes then serves a range over
+        # every segment instead of materializing N boxed ints per clear
+        self._explicit_filter:        list[int] | None = None
+
+        # filter scan structures: all lowercased texts joined into one bytes
+        # blob (0x1f never appears in stripped transcript text) plus the
+        # byte offset of each segment, so a filter pass is a few blob.find
+        # calls in C instead of a Python loop over every segment
+        self._caption_blob:    bytes = b''
+        self._caption_offsets: list[int] = []
 
         # cursor positions
         self.caption_list_cursor_pos = 0
         self.cursor_jump = 10
+
+        # rendered slice of filtered_indexes currently in the Text widget
+        self._render_window: tuple[int, int] = (0, 0)
+        self._caption_rebuilding = False
+        self._filter_after_id: str | None = None
         
         # media load counters
         self._load_fail_count = 0
@@ -63,19 +99,64 @@ class Player:
     def _load_segments(self, transcript) -> None:
         if not transcript.exists():
             raise FileNotFoundError(f'Transcript not found: {transcript}')
-        payload = json.loads(transcript.read_text(encoding='utf-8'))
+        raw = transcript.read_bytes()
+        payload = orjson.loads(raw) if orjson is not None else json.loads(raw)
         raw_segments = payload.get('segments', [])
         if not isinstance(raw_segments, list):
             raise ValueError("Transcript has no valid 'segments' list")
         
+        # blob + offsets built alongside the rows; _on_filter_query_change
+        # scans these
+        blob_parts: list[bytes] = []
+        offsets: list[int] = []
+        off = 0
         for i, seg in enumerate(raw_segments):
-            text = str(seg.get('text, ')).strip().replace('\n', ' ')
+            text = str(seg.get('text', '')).strip().replace('\n', ' ')
             if not text: continue
             start = float(seg.get('start', 0.0))
             end   = float(seg.get('end', start))
-            segment = SegmentRow(idx=i, start=start, end=end, text=text, text_lc=text.lower())
-            self.segments.append(segment)
-            self.seg_starts.append(start)
+            text_lc = text.lower()
+            text_lc_b = text_lc.encode('utf-8')
+            segment = SegmentRow(
+                idx=i, start=start, end=end,
+                text=text, text_lc=text_lc, text_lc_b=text_lc_b,
+                prefix=f"[{_fmt_hms(start)}] ")
+            self.caption_segments.append(segment)
+            self.caption_seg_starts.append(start)
+            blob_parts.append(text_lc_b)
+            offsets.append(off)
+            off += len(text_lc_b) + 1
+        self._explicit_filter = None
+        self._caption_blob = b'\x1f'.join(blob_parts)
+        self._caption_offsets = offsets
+
+    @property
+    def filtered_indexes(self) -> list[int] | range:
+        # range subscripts, iterates, and sizes like the list does, so
+        # callers are agnostic to whether a filter is active
+        if self._explicit_filter is not None:
+            return self._explicit_filter
+        return range(len(self.caption_segments))
+
+    def _segment_at(self, time: float) -> int:
+        # segment whose start is at or before `time`: O(log N) over the
+        # packed start column, for the caption highlighter and seek sync
+        return max(0, bisect_right(self.caption_seg_starts, time) - 1)
+
+    def _scan_caption_blob(self, query_b: bytes) -> list[int]:
+        # one blob.find per matching segment: after a hit the scan resumes
+        # at the next segment's offset, so each row is reported once and the
+        # result comes back sorted
+        blob = self._caption_blob
+        offsets = self._caption_offsets
+        hits: list[int] = []
+        pos = blob.find(query_b)
+        while pos != -1:
+            idx = bisect_right(offsets, pos) - 1
+            hits.append(idx)
+            next_off = offsets[idx + 1] if idx + 1 < len(offsets) else len(blob)
+            pos = blob.find(query_b, next_off)
+        return hits
 
     def _setup_styles(self) -> None:
         theme = Theme.USER if Theme.USER is not 'unset' else Theme.BASE
@@ -218,6 +299,8 @@ class Player:
                                                     background=Colorscheme.CAPTION_SELECT_BG)
         self.caption_list.tag_configure("selected_txt", font=self._text_font_bold)
 
+        self.caption_list.configure(yscrollcommand=self._on_caption_yscroll)
+
     def _build_vlc(self) -> None:
         self.vlc_instance = vlc.Instance(
             "--quiet",
@@ -246,7 +329,7 @@ class Player:
         self._bind_video_output(handle)
         self.vlc_player.play()
         self._startup_poll_count = 0
-        self.root.after(350, lambda: self._post_media_load(start_time))
+        self.root.after(350, self._post_media_load, start_time)
 
     def _bind_video_output(self, handle: int) -> None:
         match sys.platform[5:]:
@@ -261,13 +344,13 @@ class Player:
                      vlc.State.NothingSpecial):
             if self._startup_poll_count < 8:
                 self._startup_poll_count += 1
-                self.root.after(250, self._post_media_load(start_time))
+                self.root.after(250, self._post_media_load, start_time)
                 return
         if state == vlc.State.Stopped:
             if self._startup_poll_count < 3:
                 self._startup_poll_count += 1
                 self.vlc_player.play()
-                self.root.after(250, self._post_media_load(start_time))
+                self.root.after(250, self._post_media_load, start_time)
                 return
         if state in (vlc.State.Ended,
                      vlc.State.Error,
@@ -281,53 +364,103 @@ class Player:
         self._load_fail_count = 0
         self._startup_poll_count = 0
 
-    def _refresh_caption_list(self) -> None:
+    def _refresh_caption_list(self, center_pos: int | None = None) -> None:
+        if center_pos is None:
+            center_pos = self.caption_list_cursor_pos
+
+        # windowed rendering: only the rows within RENDER_OVERSCAN of the
+        # center are materialized, so refresh cost is O(window) no matter
+        # how many segments the filter matches; scrolling near an edge
+        # re-renders around the new center (_on_caption_yscroll)
+        n = len(self.filtered_indexes)
+        win_lo = max(0, min(center_pos, n) - self.RENDER_OVERSCAN)
+        win_hi = min(n, center_pos + self.RENDER_OVERSCAN + 1)
+        self._render_window = (win_lo, win_hi)
+
+        self._caption_rebuilding = True
         self.caption_list.configure(state="normal")
         self.caption_list.delete("1.0", tk.END)
-        self._caption_row_ranges = []
-        self._caption_row_text_ranges = []
-        
-        query = self.caption_filter_query.get().strip().lower()
+        self.caption_row_ranges = []
+        self.caption_row_text_ranges = []
 
-        for idx in self.filtered_indexes:
+        query = self.caption_filter_query.get().strip().lower()
+        # compiled once per refresh; finditer runs the match loop in the
+        # regex engine instead of interpreted find/arithmetic per hit
+        pattern = re.compile(re.escape(query)) if query else None
+        match_spans: list[str] = []
+
+        # every row is exactly one line, so all indexes are known up front
+        # from a running line counter; the rows then land in one insert and
+        # one tag_add per tag instead of 4+ Tcl round-trips per segment
+        rows: list[str] = []
+        ts_spans:  list[str] = []
+        txt_spans: list[str] = []
+        line = 1
+        for idx in self.filtered_indexes[win_lo:win_hi]:
             seg = self.caption_segments[idx]
-            line_start = self.caption_list.index("end-1c")
-            prefix = f"[{_fmt_hms(seg.start)}] "
-            ts_range =  [line_start, f'{line_start}+{len(prefix)}c']
-            txt_range = [ts_range[1], f'{line_start}*{len(prefix)+len(seg.text)}c']
-            self.caption_list.insert(tk.END, prefix + seg.text + "\n",("row",))
-            self.caption_list.tag_add("ts", ts_range[0], ts_range[1])
-            self.caption_list.tag_add("txt", txt_range[0], txt_range[1])
-            self.caption_row_text_ranges.append((txt_range[0], txt_range[1],))
-            line_end = self.caption_list.index("end-1c")
-            self.caption_row_ranges.append((line_start, line_end))
-
-            if query:
-                pos = 0
-                while True:
-                    hit = seg.text_lc.find(query, pos)
-                    if hit == -1: break
-                    pos = hit + len(query)
-                    s = f'{line_start}+{len(prefix)+hit}c'
-                    e = f'{line_start}+{len(prefix)+pos}c'
-                    self.caption_list.tag_add("match", s, e)
-        
+            prefix = seg.prefix
+            plen = len(prefix)
+            rows.append(prefix + seg.text + "\n")
+            ts_spans  += (f'{line}.0', f'{line}.{plen}')
+            txt_start = f'{line}.{plen}'
+            txt_end   = f'{line}.{plen + len(seg.text)}'
+            txt_spans += (txt_start, txt_end)
+            self.caption_row_text_ranges.append((txt_start, txt_end))
+            self.caption_row_ranges.append((f'{line}.0', f'{line + 1}.0'))
+
+            if pattern is not None:
+                for m in pattern.finditer(seg.text_lc):
+                    match_spans.append(f'{line}.{plen + m.start()}')
+                    match_spans.append(f'{line}.{plen + m.end()}')
+            line += 1
+
+        if rows:
+            self.caption_list.insert("1.0", "".join(rows), ("row",))
+            self.caption_list.tag_add("ts", *ts_spans)
+            self.caption_list.tag_add("txt", *txt_spans)
+        # tag add accepts interleaved range pairs: one Tcl call for every
+        # highlight in the refresh instead of one per hit
+        if match_spans:
+            self.caption_list.tag_add("match", *match_spans)
+
         if self.filtered_indexes:
-            self._select_pos(self.caption_list_cursor_pos)
+            if win_lo <= self.caption_list_cursor_pos < win_hi:
+                self._select_pos(self.caption_list_cursor_pos)
         else:
             self.status.set('No Matches Found.')
         self.caption_list.configure(state='disabled')
+        self._caption_rebuilding = False
+
+    def _on_caption_yscroll(self, first: str, last: str) -> None:
+        # re-center the rendered window when the view nears either edge of
+        # what has been materialized so far
+        if self._caption_rebuilding: return
+        fl, ll = float(first), float(last)
+        win_lo, win_hi = self._render_window
+        n = len(self.filtered_indexes)
+        if not ((fl <= 0.02 and win_lo > 0) or (ll >= 0.98 and win_hi < n)):
+            return
+        center = win_lo + int(((fl + ll) / 2.0) * max(1, win_hi - win_lo))
+        self._refresh_caption_list(center_pos=center)
+        self.caption_list.see(f'{max(1, center - self._render_window[0] + 1)}.0')
 
     def _select_pos(self, pos: int) -> None:
         if not self.filtered_indexes: return
         pos = max(0, min(pos, len(self.filtered_indexes) - 1))
         self.caption_list_cursor_pos = pos
+        win_lo, win_hi = self._render_window
+        if pos < win_lo or pos >= win_hi:
+            # cursor moved outside the rendered window: re-render around it;
+            # the refresh re-applies the selection tags
+            self._refresh_caption_list(center_pos=pos)
+            return
+        local = pos - win_lo
 
         self.caption_list.configure(state='normal')
         self.caption_list.tag_remove('selected', '1.0', tk.END)
         self.caption_list.tag_remove('selected_txt', '1.0', tk.END)
-        line_range = self.caption_row_ranges[pos]
-        text_range = self.caption_row_text_ranges[pos]
+        line_range = self.caption_row_ranges[local]
+        text_range = self.caption_row_text_ranges[local]
         self.caption_list.tag_add('selected', line_range[0], line_range[1])
         self.caption_list.tag_add('selected_txt', text_range[0], text_range[1])
         self.caption_list.see(line_range[0])
@@ -404,12 +537,24 @@ class Player:
 
     # ----- Events -----
 
-    def _on_filter_query_change(self) -> None:
+    def _on_filter_query_change(self, *_args: object) -> None:
+        # coalesce keystroke bursts into one filter pass + refresh; an
+        # emptied query applies immediately so clearing feels instant
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+        if not self.caption_filter_query.get().strip():
+            self._apply_filter()
+            return
+        self._filter_after_id = self.root.after(120, self._apply_filter)
+
+    def _apply_filter(self) -> None:
+        self._filter_after_id = None
         query = self.caption_filter_query.get().strip().lower()
         if not query:
-            self.filtered_indexes = list(range(len(self.caption_segments)))
+            self._explicit_filter = None
         else:
-            self.filtered_indexes = [idx for idx, seg in enumerate(self.caption_segments) if query in seg.text_lc]
+            self._explicit_filter = self._scan_caption_blob(query.encode('utf-8'))
         self.caption_list_cursor_pos = 0
         self._refresh_caption_list()
 
@@ -458,7 +603,7 @@ class Player:
 
     def _on_double_click(self, event:tk.Event[tk.misc]) -> str:
         index = self.caption_list.index(f'@{event.x},{event.y}')
-        line = int(index.split(".")[0]) - 1
+        line = int(index.split(".")[0]) - 1 + self._render_window[0]
         if 0 <= line < len(self.filtered_indexes):
             self._select_pos(line)
         return self._on_return(event)